@@ -13,19 +13,28 @@ Features:
 - Password hashing and validation
 - JWT token-based authentication
 - Input validation and error handling
+
+Note: The endpoints are plain `def` functions on purpose. They only do
+blocking work (SQLAlchemy queries, password hashing), so FastAPI runs them in
+its threadpool instead of stalling the event loop.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from pydantic import BaseModel, EmailStr, field_validator
-from sqlalchemy.orm import Session
+from pydantic import BaseModel, EmailStr, field_validator, model_validator
+from sqlalchemy import or_
+from sqlalchemy.orm import Session, load_only
+from cachetools import LRUCache
 from datetime import timedelta
 from typing import Optional
-from ..database import get_db
+import threading
+from ..database import get_db, SessionLocal
 from ..models.db_models import User, InstitutionKey
 from ..utils.auth import (
     verify_password, 
     get_password_hash, 
+    password_needs_rehash,
+    truncate_password,
     create_access_token,
     get_current_user,
     ACCESS_TOKEN_EXPIRE_MINUTES
@@ -43,6 +52,9 @@ router = APIRouter(prefix="/auth", tags=["authentication"])
 # Pydantic Models for Request/Response Validation
 # ============================================================================
 
+# Roles a user can register with
+VALID_ROLES = frozenset({"admin", "institution", "student"})
+
 class UserCreate(BaseModel):
     """
     Request model for user registration.
@@ -80,24 +92,25 @@ class UserCreate(BaseModel):
         if len(v) < 6:
             raise ValueError("Password must be at least 6 characters long")
         
-        # Convert to bytes to check actual byte length (handles UTF-8 multi-byte chars)
-        password_bytes = v.encode('utf-8')
-        
-        # If password exceeds 72 bytes, truncate it
-        if len(password_bytes) > 72:
-            # Truncate to 72 bytes
-            password_bytes = password_bytes[:72]
-            # Decode back to string, handling potential incomplete UTF-8 sequences
-            v = password_bytes.decode('utf-8', errors='ignore')
-            # Ensure we have valid UTF-8 by trying to encode again
-            try:
-                v.encode('utf-8')
-            except UnicodeEncodeError:
-                # If still invalid, take first 71 bytes
-                password_bytes = password_bytes[:71]
-                v = password_bytes.decode('utf-8', errors='ignore')
+        # Truncate to 72 bytes (handles multi-byte UTF-8 characters)
+        v = truncate_password(v)
         
         return v
+    
+    @field_validator('role')
+    @classmethod
+    def validate_role(cls, v: str) -> str:
+        """Reject unknown roles at parse time (HTTP 422, no database access)."""
+        if v not in VALID_ROLES:
+            raise ValueError("Invalid role. Must be admin, institution, or student")
+        return v
+    
+    @model_validator(mode='after')
+    def validate_institution_fields(self) -> 'UserCreate':
+        """Institutions must provide issuer_id and issuer_name."""
+        if self.role == "institution" and not (self.issuer_id and self.issuer_name):
+            raise ValueError("Institutions must provide issuer_id and issuer_name")
+        return self
 
 class UserResponse(BaseModel):
     """
@@ -117,6 +130,31 @@ class UserResponse(BaseModel):
     class Config:
         from_attributes = True  # Allow creation from SQLAlchemy models
 
+def _user_to_dict(user: User) -> dict:
+    """
+    Build the public user representation returned by the API.
+    
+    Endpoints return this plain dict instead of declaring
+    `response_model=UserResponse`, which skips re-validating the ORM object
+    on every call. UserResponse is still referenced in `responses=` so the
+    OpenAPI schema is unchanged.
+    
+    Args:
+        user: User ORM object
+    
+    Returns:
+        dict: User fields matching UserResponse (no password hash)
+    """
+    return {
+        "id": user.id,
+        "username": user.username,
+        "email": user.email,
+        "role": user.role,
+        "issuer_id": user.issuer_id,
+        "issuer_name": user.issuer_name,
+        "is_active": user.is_active
+    }
+
 class Token(BaseModel):
     """
     Response model for authentication tokens.
@@ -132,8 +170,59 @@ class Token(BaseModel):
 # Registration Endpoint
 # ============================================================================
 
-@router.post("/register", response_model=UserResponse)
-async def register(user_data: UserCreate, db: Session = Depends(get_db)):
+# Error message for each identifier that must be unique
+_DUPLICATE_DETAILS = {
+    "username": "Username already registered",
+    "email": "Email already registered",
+    "issuer_id": "Issuer ID already registered",
+}
+
+# (field, value) pairs known to be taken. Only positive results are cached:
+# users are never deleted or renamed, so an entry can never go stale, while
+# a free identifier must always be confirmed against the database.
+_taken_cache = LRUCache(maxsize=1024)
+_taken_cache_lock = threading.Lock()
+
+def _is_taken(field: str, value: str) -> bool:
+    """Check the in-memory cache for an identifier known to be taken."""
+    with _taken_cache_lock:
+        return (field, value) in _taken_cache
+
+def _mark_taken(field: str, value: str) -> None:
+    """Remember that an identifier is taken (after a conflict or insert)."""
+    with _taken_cache_lock:
+        _taken_cache[(field, value)] = True
+
+def _create_institution_key(user_id: int, issuer_id: str) -> None:
+    """
+    Generate and store the ECDSA key pair for a newly registered institution.
+    
+    Runs as a background task after registration, so it opens its own
+    database session instead of reusing the (already closed) request session.
+    
+    Args:
+        user_id: ID of the institution user
+        issuer_id: Institution identifier (for quick key lookup)
+    """
+    key_pair = generate_key_pair()
+    db = SessionLocal()
+    try:
+        db.add(InstitutionKey(
+            user_id=user_id,
+            issuer_id=issuer_id,
+            private_key_encrypted=key_pair['private_key'],  # In production, encrypt this!
+            public_key=key_pair['public_key']
+        ))
+        db.commit()
+    finally:
+        db.close()
+
+@router.post("/register", responses={200: {"model": UserResponse}})
+def register(
+    user_data: UserCreate,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db)
+):
     """
     Register a new user account.
     
@@ -141,72 +230,60 @@ async def register(user_data: UserCreate, db: Session = Depends(get_db)):
     For institutions, it also generates an ECDSA key pair for certificate signing.
     
     Process:
-    1. Validate username and email are unique
-    2. Validate role is valid
-    3. For institutions, validate issuer_id and issuer_name are provided
+    1. Validate role is valid (UserCreate validator)
+    2. For institutions, validate issuer_id and issuer_name are provided (UserCreate validator)
+    3. Validate username, email (and issuer_id) are unique in one query
     4. Hash the password
     5. Create user record in database
-    6. For institutions, generate and store ECDSA key pair
+    6. For institutions, schedule ECDSA key pair generation (background task)
     7. Return user information (without password)
     
     Args:
         user_data: User registration data (username, email, password, role, etc.)
+        background_tasks: FastAPI background tasks (for institution key generation)
         db: Database session (injected by FastAPI)
     
     Returns:
-        UserResponse: Created user information
+        dict: Created user information (UserResponse shape)
     
     Raises:
-        HTTPException: 400 if validation fails (duplicate username/email, invalid role, etc.)
+        HTTPException: 400 if username, email or issuer_id is already registered
+        HTTPException: 422 if the request body is invalid (bad role, missing issuer fields, etc.)
     """
     # ========================================================================
-    # Validation: Check for duplicate username
-    # ========================================================================
-    existing_user = db.query(User).filter(User.username == user_data.username).first()
-    if existing_user:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Username already registered"
-        )
-    
-    # ========================================================================
-    # Validation: Check for duplicate email
-    # ========================================================================
-    existing_email = db.query(User).filter(User.email == user_data.email).first()
-    if existing_email:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email already registered"
-        )
-    
-    # ========================================================================
-    # Validation: Check role is valid
-    # ========================================================================
-    if user_data.role not in ["admin", "institution", "student"]:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid role. Must be admin, institution, or student"
-        )
-    
-    # ========================================================================
-    # Validation: Institutions must provide issuer information
+    # Validation: Check for duplicate username, email and issuer_id
     # ========================================================================
+    candidates = [("username", user_data.username), ("email", user_data.email)]
     if user_data.role == "institution":
-        if not user_data.issuer_id or not user_data.issuer_name:
+        candidates.append(("issuer_id", user_data.issuer_id))
+    
+    # Identifiers already seen as taken are rejected without a database hit
+    for field, value in candidates:
+        if _is_taken(field, value):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Institutions must provide issuer_id and issuer_name"
+                detail=_DUPLICATE_DETAILS[field]
             )
-        # Check if issuer_id already exists (must be unique)
-        existing_issuer = db.query(User).filter(
-            User.issuer_id == user_data.issuer_id
-        ).first()
-        if existing_issuer:
+    
+    # A single round-trip fetches every conflicting row; we then branch locally
+    # so the error precedence (username, then email, then issuer) is unchanged.
+    conflicts = db.query(User.username, User.email, User.issuer_id).filter(
+        or_(*(getattr(User, field) == value for field, value in candidates))
+    ).all()
+    
+    for field, value in candidates:
+        if any(getattr(row, field) == value for row in conflicts):
+            _mark_taken(field, value)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Issuer ID already registered"
+                detail=_DUPLICATE_DETAILS[field]
             )
     
+    # Return the pooled connection before hashing: the hash takes tens of
+    # milliseconds and needs no database, and the insert below checks a
+    # connection out again
+    db.close()
+    
     # ========================================================================
     # Create User Record
     # ========================================================================
@@ -222,19 +299,9 @@ async def register(user_data: UserCreate, db: Session = Depends(get_db)):
             detail=f"Password error: {str(e)}"
         )
     except Exception as e:
-        # Handle bcrypt/passlib compatibility issues
-        error_msg = str(e)
-        if "bcrypt" in error_msg.lower() or "__about__" in error_msg:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=(
-                    "Password hashing failed due to bcrypt version incompatibility. "
-                    "Please reinstall bcrypt 3.2.2: pip uninstall bcrypt && pip install bcrypt==3.2.2"
-                )
-            )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Password hashing error: {error_msg}"
+            detail=f"Password hashing error: {str(e)}"
         )
     
     # Create new user object
@@ -247,38 +314,58 @@ async def register(user_data: UserCreate, db: Session = Depends(get_db)):
         issuer_name=user_data.issuer_name
     )
     
-    # Add to database session
+    # ========================================================================
+    # Commit Transaction
+    # ========================================================================
     db.add(new_user)
-    db.flush()  # Flush to get the user ID
+    db.commit()
+    db.refresh(new_user)  # Refresh to get database-generated fields
     
     # ========================================================================
     # Generate ECDSA Key Pair for Institutions
     # ========================================================================
-    # Institutions need key pairs to sign certificates
+    # Institutions need key pairs to sign certificates. The key isn't part of
+    # the response, so it is generated after the response is sent.
     if user_data.role == "institution":
-        key_pair = generate_key_pair()
-        institution_key = InstitutionKey(
-            user_id=new_user.id,
-            issuer_id=user_data.issuer_id,
-            private_key_encrypted=key_pair['private_key'],  # In production, encrypt this!
-            public_key=key_pair['public_key']
-        )
-        db.add(institution_key)
+        background_tasks.add_task(_create_institution_key, new_user.id, user_data.issuer_id)
     
-    # ========================================================================
-    # Commit Transaction
-    # ========================================================================
-    db.commit()
-    db.refresh(new_user)  # Refresh to get database-generated fields
+    for field, value in candidates:
+        _mark_taken(field, value)
     
-    return new_user
+    return _user_to_dict(new_user)
 
 # ============================================================================
 # Login Endpoint
 # ============================================================================
 
+# Hash verified against when the username is unknown, so failed logins take
+# the same time whether or not the account exists (no user enumeration)
+_DUMMY_HASH = get_password_hash("invalid-password-placeholder")
+
+def _rehash_password(user_id: int, password: str) -> None:
+    """
+    Re-hash a user's password with the current hashing settings.
+    
+    Runs as a background task after a successful login, so it opens its own
+    database session instead of reusing the (already closed) request session.
+    
+    Args:
+        user_id: ID of the user whose hash is outdated
+        password: The plain text password that was just verified
+    """
+    hashed_password = get_password_hash(password)
+    db = SessionLocal()
+    try:
+        db.query(User).filter(User.id == user_id).update(
+            {User.hashed_password: hashed_password}, synchronize_session=False
+        )
+        db.commit()
+    finally:
+        db.close()
+
 @router.post("/login", response_model=Token)
-async def login(
+def login(
+    background_tasks: BackgroundTasks,
     form_data: OAuth2PasswordRequestForm = Depends(),
     db: Session = Depends(get_db)
 ):
@@ -293,9 +380,11 @@ async def login(
     2. Verify password against stored hash
     3. Check if user account is active
     4. Generate JWT token with user information
-    5. Return token to client
+    5. Return token to client (outdated password hashes are upgraded
+       in the background after the response is sent)
     
     Args:
+        background_tasks: FastAPI background tasks (for lazy re-hashing)
         form_data: OAuth2 password form (username and password)
         db: Database session (injected by FastAPI)
     
@@ -309,13 +398,29 @@ async def login(
     # ========================================================================
     # Look Up User
     # ========================================================================
-    user = db.query(User).filter(User.username == form_data.username).first()
+    # Only the columns needed to authenticate and build the token are loaded
+    user = db.query(User).options(
+        load_only(User.id, User.username, User.hashed_password, User.role, User.is_active)
+    ).filter(User.username == form_data.username).first()
+    
+    # Password verification is slow and needs no database, so the pooled
+    # connection is returned first. The user stays usable: close() detaches
+    # it without expiring the columns loaded above.
+    db.close()
     
     # ========================================================================
     # Verify Credentials
     # ========================================================================
-    # Check if user exists and password is correct
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    # Check if user exists and password is correct. Unknown users still pay
+    # for one password verify so response time doesn't reveal valid usernames.
+    if not user:
+        verify_password(form_data.password, _DUMMY_HASH)
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Incorrect username or password",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    if not verify_password(form_data.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
@@ -331,6 +436,13 @@ async def login(
             detail="Inactive user"
         )
     
+    # ========================================================================
+    # Upgrade Outdated Password Hash
+    # ========================================================================
+    # Done after the response so the user isn't blocked on a second hash
+    if password_needs_rehash(user.hashed_password):
+        background_tasks.add_task(_rehash_password, user.id, form_data.password)
+    
     # ========================================================================
     # Generate JWT Token
     # ========================================================================
@@ -348,8 +460,8 @@ async def login(
 # Current User Information Endpoint
 # ============================================================================
 
-@router.get("/me", response_model=UserResponse)
-async def get_current_user_info(current_user: User = Depends(get_current_user)):
+@router.get("/me", responses={200: {"model": UserResponse}})
+def get_current_user_info(current_user: User = Depends(get_current_user)):
     """
     Get information about the currently authenticated user.
     
@@ -360,16 +472,16 @@ async def get_current_user_info(current_user: User = Depends(get_current_user)):
         current_user: Authenticated user (from get_current_user dependency)
     
     Returns:
-        UserResponse: Current user's information
+        dict: Current user's information (UserResponse shape)
     """
-    return current_user
+    return _user_to_dict(current_user)
 
 # ============================================================================
 # Logout Endpoint
 # ============================================================================
 
 @router.post("/logout")
-async def logout(current_user: User = Depends(get_current_user)):
+def logout(current_user: User = Depends(get_current_user)):
     """
     Logout endpoint for explicit logout.
     
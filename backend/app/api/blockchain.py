@@ -9,13 +9,17 @@ This module provides REST API endpoints for querying blockchain information:
 
 All endpoints are public (no authentication required) as they only provide
 read-only information about the blockchain state.
+
+Blocks live on Ethereum (see EthereumService), so these endpoints read from
+the node only and don't open a database session. The endpoints are plain
+`def` functions since web3 calls are blocking; FastAPI runs them in its
+threadpool.
 """
 
-from fastapi import APIRouter, HTTPException, Depends
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, HTTPException, Request
 import os
-from ..database import get_db
 from ..services.ethereum_helper import get_ethereum_service
+from ..utils.http_cache import cached_json_response
 
 # ============================================================================
 # API Router Setup
@@ -23,12 +27,29 @@ from ..services.ethereum_helper import get_ethereum_service
 
 router = APIRouter(prefix="/blockchain", tags=["blockchain"])
 
+# Network data changes once per block (~2-12 s), so browsers and proxies may
+# reuse responses briefly instead of every poll reaching the node
+NETWORK_CACHE_CONTROL = "public, max-age=3, stale-while-revalidate=10"
+
+# Message returned by /validate when the node is reachable; only the
+# network details vary between calls
+_VALID_MESSAGE_TEMPLATE = (
+    '✅ Ethereum Network Connected Successfully\n\n'
+    'Network: {network}\n'
+    'Current Block: {block_number}\n'
+    'Contract Address: {contract_address}\n\n'
+    '📋 System Status:\n'
+    '• Certificates are stored on Ethereum blockchain\n'
+    '• All certificate data is immutable and tamper-proof\n'
+    '• To verify a certificate, use the certificate ID in the "Verify Certificate" tab'
+)
+
 # ============================================================================
 # Blockchain Information Endpoint
 # ============================================================================
 
 @router.get("/info")
-async def get_blockchain_info(db: Session = Depends(get_db)):
+def get_blockchain_info(request: Request):
     """
     Get blockchain statistics and information.
     
@@ -41,8 +62,11 @@ async def get_blockchain_info(db: Session = Depends(get_db)):
     This is a public endpoint (no authentication required) as it only
     provides read-only information.
     
+    Responses carry an ETag and a short Cache-Control lifetime; a matching
+    If-None-Match header gets an empty 304 response.
+    
     Args:
-        db: Database session (injected by FastAPI)
+        request: Incoming request (for conditional GET handling)
     
     Returns:
         dict: Blockchain statistics and information
@@ -65,10 +89,10 @@ async def get_blockchain_info(db: Session = Depends(get_db)):
             'connected': network_info.get('connected', False)
         }
         
-        return {
+        return cached_json_response(request, {
             "success": True,
             "blockchain_info": info
-        }
+        }, NETWORK_CACHE_CONTROL)
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -77,7 +101,7 @@ async def get_blockchain_info(db: Session = Depends(get_db)):
 # ============================================================================
 
 @router.get("/validate")
-async def validate_blockchain(db: Session = Depends(get_db)):
+def validate_blockchain(request: Request):
     """
     Validate the integrity of the blockchain.
     
@@ -90,8 +114,10 @@ async def validate_blockchain(db: Session = Depends(get_db)):
     This is a public endpoint (no authentication required) as validation
     is a read-only operation.
     
+    Successful responses carry an ETag and a short Cache-Control lifetime.
+    
     Args:
-        db: Database session (injected by FastAPI)
+        request: Incoming request (for conditional GET handling)
     
     Returns:
         dict: Validation result with:
@@ -122,17 +148,19 @@ async def validate_blockchain(db: Session = Depends(get_db)):
         network_name = network_info.get('network', 'unknown')
         contract_address = network_info.get('contract_address', 'N/A')
         
-        # Create a more informative message
-        message = f'✅ Ethereum Network Connected Successfully\n\n'
-        message += f'Network: {network_name.upper()}\n'
-        message += f'Current Block: {block_number}\n'
-        message += f'Contract Address: {contract_address[:20]}...{contract_address[-10:] if len(contract_address) > 30 else contract_address}\n\n'
-        message += f'📋 System Status:\n'
-        message += f'• Certificates are stored on Ethereum blockchain\n'
-        message += f'• All certificate data is immutable and tamper-proof\n'
-        message += f'• To verify a certificate, use the certificate ID in the "Verify Certificate" tab'
+        # Shorten long addresses for display (0x1234...abcd)
+        if len(contract_address) > 30:
+            short_address = f'{contract_address[:20]}...{contract_address[-10:]}'
+        else:
+            short_address = contract_address
+        
+        message = _VALID_MESSAGE_TEMPLATE.format(
+            network=network_name.upper(),
+            block_number=block_number,
+            contract_address=short_address
+        )
         
-        return {
+        return cached_json_response(request, {
             "success": True,
             "valid": True,
             "message": message,
@@ -142,7 +170,7 @@ async def validate_blockchain(db: Session = Depends(get_db)):
             "network": network_name,
             "contract_address": contract_address,
             "block_number": block_number
-        }
+        }, NETWORK_CACHE_CONTROL)
     except ValueError as e:
         # Handle contract deployment errors with helpful message
         error_msg = str(e)
@@ -176,7 +204,7 @@ async def validate_blockchain(db: Session = Depends(get_db)):
 # ============================================================================
 
 @router.get("/blocks")
-async def get_all_blocks(db: Session = Depends(get_db)):
+def get_all_blocks(request: Request):
     """
     Get all blocks in the blockchain.
     
@@ -187,7 +215,7 @@ async def get_all_blocks(db: Session = Depends(get_db)):
     want to paginate results for large blockchains.
     
     Args:
-        db: Database session (injected by FastAPI)
+        request: Incoming request (for conditional GET handling)
     
     Returns:
         dict: All blocks with:
@@ -202,12 +230,12 @@ async def get_all_blocks(db: Session = Depends(get_db)):
         ethereum_service = get_ethereum_service()
         network_info = ethereum_service.get_network_info()
         
-        return {
+        return cached_json_response(request, {
             "success": True,
             "message": "Ethereum doesn't track individual blocks in this system. Use /blockchain/info for network information.",
             "network_info": network_info,
             "note": "Ethereum manages its own blocks. This system only interacts with the smart contract."
-        }
+        }, cache_control=NETWORK_CACHE_CONTROL)
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -216,14 +244,15 @@ async def get_all_blocks(db: Session = Depends(get_db)):
 # ============================================================================
 
 @router.get("/latest-block")
-async def get_latest_block(db: Session = Depends(get_db)):
+def get_latest_block(request: Request):
     """
     Get the latest Ethereum block information.
     
     This endpoint returns information about the current Ethereum block.
+    Responses carry an ETag and a short Cache-Control lifetime.
     
     Args:
-        db: Database session (injected by FastAPI)
+        request: Incoming request (for conditional GET handling)
     
     Returns:
         dict: Latest block information
@@ -235,12 +264,12 @@ async def get_latest_block(db: Session = Depends(get_db)):
         ethereum_service = get_ethereum_service()
         network_info = ethereum_service.get_network_info()
         
-        return {
+        return cached_json_response(request, {
             "success": True,
             "block_number": network_info.get('block_number'),
             "chain_id": network_info.get('chain_id'),
             "network": network_info.get('network'),
             "message": "Ethereum manages its own blocks. This shows the current block number."
-        }
+        }, NETWORK_CACHE_CONTROL)
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -2,7 +2,7 @@
 Certificate Management API Endpoints Module
 
 This module provides REST API endpoints for certificate operations:
-- Certificate issuance (with authentication, ECDSA signing, privacy)
+- Certificate issuance, single or batch (with authentication, ECDSA signing, privacy)
 - Certificate verification (public, with signature and Merkle proof verification)
 - Certificate querying (by student, by issuer)
 - Certificate revocation (with authentication)
@@ -12,25 +12,71 @@ Key Features:
 - ECDSA digital signatures for certificate authenticity
 - Privacy-preserving blockchain storage (PII hashes only)
 - Merkle tree verification for efficient certificate validation
+
+Note: The endpoints are plain `def` functions. Every one of them blocks on
+SQLAlchemy queries, Ethereum RPC calls or ECDSA signing, so FastAPI runs
+them in its threadpool and other requests keep being served meanwhile.
 """
 
-from fastapi import APIRouter, HTTPException, Depends
-from pydantic import BaseModel
+from fastapi import APIRouter, HTTPException, Depends, Query, Request
+from pydantic import BaseModel, ConfigDict, Field
+from sqlalchemy import case, func
 from sqlalchemy.orm import Session
-from typing import List, Dict, Any
+from cachetools import LRUCache, TTLCache
+from typing import Annotated, List, Dict, Any, Optional
 from ..database import get_db
-from ..models.db_models import CertificateDB, InstitutionKey, CertificateSignature, CertificateIndex
+from ..models.db_models import InstitutionKey, CertificateIndex
 from ..services.ethereum_helper import get_ethereum_service
-from ..utils.auth import get_current_institution, get_current_user
-from ..utils.ecdsa_utils import sign_data, verify_signature, create_certificate_hash_for_signing
-import hashlib
+from ..utils.auth import get_current_active_admin, get_current_institution
+from ..utils.http_cache import cached_json_response
 import hashlib
 import json
+import threading
 import time
-from datetime import datetime
 
 router = APIRouter(prefix="/certificates", tags=["certificates"])
 
+# ============================================================================
+# Verification Cache
+# ============================================================================
+
+# Successful /verify responses by certificate_id. Certificates are immutable
+# on chain except for revocation: revoke_certificate evicts its entry, but
+# only in the worker that handled the revoke. Other workers, and revocations
+# made outside this API, rely on the TTL, which matches the 30s record cache
+# in EthereumService.get_certificate.
+VERIFY_CACHE_TTL = 30
+_verify_cache = TTLCache(maxsize=10_000, ttl=VERIFY_CACHE_TTL)
+
+# "Not found" /verify responses, kept only briefly: certificates can also be
+# issued straight from a wallet (frontend DirectEthereumVerify flow) or by
+# another worker, which this process never sees. Absorbs repeated probes of
+# the same unknown IDs without a lasting false negative.
+VERIFY_MISS_CACHE_TTL = 30
+_verify_miss_cache = TTLCache(maxsize=10_000, ttl=VERIFY_MISS_CACHE_TTL)
+
+# Guards both verification caches
+_verify_cache_lock = threading.Lock()
+
+# Listing endpoints reflect on-chain revocations, so clients must revalidate
+# every time; the ETag still lets an unchanged list come back as an empty 304
+LIST_CACHE_CONTROL = "no-cache"
+
+# Page size bounds for the listing endpoints. Every listed certificate costs
+# an Ethereum lookup, so unbounded lists are slow and memory hungry.
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+# Issuer IDs known to have an ECDSA key pair. Only positive results are
+# cached: keys are created once at registration and never deleted or
+# rotated, so an entry can never go stale.
+_keyed_issuers = LRUCache(maxsize=256)
+_keyed_issuers_lock = threading.Lock()
+
+# Shared by the request models: strict (no type coercion), immutable once
+# validated, and every string capped so oversized payloads fail fast
+REQUEST_MODEL_CONFIG = ConfigDict(strict=True, frozen=True, str_max_length=256)
+
 class CertificateRequest(BaseModel):
     """
     Request model for certificate issuance.
@@ -46,20 +92,28 @@ class CertificateRequest(BaseModel):
         grade: Student's grade (PII)
         course_duration: Optional course duration
     """
+    model_config = REQUEST_MODEL_CONFIG
+    
     student_name: str
     student_id: str
     course_name: str
     grade: str
-    course_duration: str = None
+    course_duration: Optional[str] = None
 
 class VerificationRequest(BaseModel):
     """
     Request model for certificate verification.
     
     Fields:
-        certificate_id: Unique certificate identifier to verify
+        certificate_id: Unique certificate identifier to verify (16 uppercase
+            hex characters, as produced by create_certificate_id)
+    
+    Malformed IDs are rejected during validation (422) without any
+    blockchain lookup.
     """
-    certificate_id: str
+    model_config = REQUEST_MODEL_CONFIG
+    
+    certificate_id: Annotated[str, Field(pattern=r"^[A-F0-9]{16}$")]
 
 class RevocationRequest(BaseModel):
     """
@@ -69,8 +123,161 @@ class RevocationRequest(BaseModel):
         certificate_id: Certificate identifier to revoke
         reason: Optional reason for revocation
     """
+    model_config = REQUEST_MODEL_CONFIG
+    
+    certificate_id: str
+    reason: Optional[str] = None
+
+# ============================================================================
+# Response Models (documentation only)
+# ============================================================================
+# The endpoints return plain dicts, which ORJSONResponse serializes directly.
+# These models are referenced through `responses=` rather than
+# `response_model=`, so the OpenAPI schema is typed without FastAPI
+# re-validating every response (the same approach as auth.UserResponse).
+
+class IssuedCertificate(BaseModel):
+    """Certificate data echoed back by /issue."""
     certificate_id: str
-    reason: str = None
+    student_name: str
+    student_id: str
+    course_name: str
+    grade: str
+    issuer_name: str
+    issuer_id: str
+    course_duration: str
+    issue_date: str
+    timestamp: float
+    status: str
+
+class IssueBlockchainInfo(BaseModel):
+    """Transaction details returned by /issue."""
+    block_number: Optional[int] = None
+    transaction_hash: Optional[str] = None
+    network: Optional[str] = None
+    contract_address: Optional[str] = None
+    gas_used: Optional[int] = None
+    blockchain_type: str
+
+class IssueResponse(BaseModel):
+    """Response of /issue."""
+    success: bool
+    message: str
+    certificate_id: str
+    certificate: IssuedCertificate
+    blockchain_info: IssueBlockchainInfo
+    note: str
+
+class VerifiedCertificate(BaseModel):
+    """Public (non-PII) certificate data returned by /verify."""
+    certificate_id: str
+    student_name: Optional[str] = None
+    student_id: Optional[str] = None
+    course_name: Optional[str] = None
+    grade: Optional[str] = None
+    issuer_id: Optional[str] = None
+    timestamp: Optional[int] = None
+    status: str
+
+class BlockchainProof(BaseModel):
+    """On-chain verification details returned by /verify."""
+    valid: bool
+    issuer: Optional[str] = None
+    timestamp: Optional[int] = None
+    revoked: bool
+    blockchain: str
+    network: Optional[str] = None
+    contract_address: Optional[str] = None
+
+class VerifyResponse(BaseModel):
+    """Response of /verify (certificate fields are absent when not found)."""
+    verified: bool
+    valid: bool
+    message: Optional[str] = None
+    certificate: Optional[VerifiedCertificate] = None
+    blockchain_proof: Optional[BlockchainProof] = None
+    signature_verified: Optional[bool] = None
+    note: Optional[str] = None
+
+class RevokeResponse(BaseModel):
+    """Response of /revoke."""
+    success: bool
+    message: str
+    certificate_id: str
+    reason: Optional[str] = None
+    transaction_hash: Optional[str] = None
+    block_number: Optional[int] = None
+
+def _has_institution_key(db: Session, issuer_id: str) -> bool:
+    """Check (with a per-process cache) that an issuer has a key pair stored."""
+    with _keyed_issuers_lock:
+        if issuer_id in _keyed_issuers:
+            return True
+    
+    found = db.query(InstitutionKey.id).filter(
+        InstitutionKey.issuer_id == issuer_id
+    ).first() is not None
+    
+    if found:
+        with _keyed_issuers_lock:
+            _keyed_issuers[issuer_id] = True
+    return found
+
+# Columns the listing endpoints read. Selecting them as plain rows skips
+# building (and identity-mapping) a full ORM object per certificate.
+_LISTING_COLUMNS = (
+    CertificateIndex.id,
+    CertificateIndex.certificate_id,
+    CertificateIndex.student_id,
+    CertificateIndex.course_name,
+    CertificateIndex.issuer_id,
+    CertificateIndex.timestamp,
+    CertificateIndex.status,
+    CertificateIndex.created_at,
+)
+
+def _fetch_page(query, limit: int, offset: int, cursor: Optional[int] = None):
+    """
+    Fetch one page of CertificateIndex rows (or column rows) in a stable (id) order.
+    
+    With a cursor (the next_cursor of the previous page) the page starts
+    right after that row via an indexed `id > cursor` range, so deep pages
+    don't make the database walk past every skipped row like OFFSET does.
+    
+    One extra row is requested to tell whether another page follows,
+    which avoids a separate COUNT query.
+    
+    Returns:
+        tuple: (rows, has_more, next_cursor)
+    """
+    if cursor is not None:
+        query = query.filter(CertificateIndex.id > cursor)
+    rows = query.order_by(CertificateIndex.id).offset(offset).limit(limit + 1).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    return rows, has_more, rows[-1].id if has_more else None
+
+def _clear_verify_misses(certificate_ids: List[str]) -> None:
+    """Forget cached "not found" /verify results for newly issued certificates."""
+    with _verify_cache_lock:
+        for certificate_id in certificate_ids:
+            _verify_miss_cache.pop(certificate_id, None)
+
+def _insert_index_entries(db: Session, entries: List[Dict[str, Any]]) -> None:
+    """
+    Insert CertificateIndex rows with one Core executemany and commit.
+    
+    Bypasses per-object ORM unit-of-work bookkeeping, which matters for
+    batch issuance; the rows are never read back within the request.
+    
+    Args:
+        db: Database session
+        entries: Column values for each row (certificate_id, student_id,
+            issuer_id, course_name, timestamp, status)
+    """
+    if entries:
+        db.execute(CertificateIndex.__table__.insert(), entries)
+    db.commit()
 
 def create_pii_hash(certificate_data: dict) -> str:
     """
@@ -93,18 +300,47 @@ def create_pii_hash(certificate_data: dict) -> str:
     Note:
         Keys are sorted to ensure consistent hashing regardless of input order
     """
-    pii_data = {
-        'student_name': certificate_data.get('student_name'),
-        'student_id': certificate_data.get('student_id'),
-        'grade': certificate_data.get('grade')
-    }
-    
-    pii_string = json.dumps(pii_data, sort_keys=True)
+    # Same bytes as json.dumps(pii_data, sort_keys=True), which existing
+    # hashes on chain were made with, without building and sorting a dict.
+    # Keys are written in sorted order; each value is still JSON-encoded so
+    # escaping and None -> null are unchanged.
+    dumps = json.dumps
+    pii_string = (
+        '{"grade": ' + dumps(certificate_data.get('grade'))
+        + ', "student_id": ' + dumps(certificate_data.get('student_id'))
+        + ', "student_name": ' + dumps(certificate_data.get('student_name'))
+        + '}'
+    )
     
     return hashlib.sha256(pii_string.encode('utf-8')).hexdigest()
 
-@router.post("/issue")
-async def issue_certificate(
+def create_certificate_id(
+    student_id: str,
+    course_name: str,
+    timestamp: float,
+    sequence: Optional[int] = None
+) -> str:
+    """
+    Derive a certificate identifier from the student, course and issue time.
+    
+    Args:
+        student_id: Student identifier
+        course_name: Name of the course
+        timestamp: Issue time (seconds since epoch)
+        sequence: Position within a batch sharing one timestamp (batch issuance
+            only), so every entry of the batch gets a distinct identifier
+    
+    Returns:
+        str: 16 character uppercase hex identifier
+    """
+    cert_string = f"{student_id}_{course_name}_{timestamp}"
+    if sequence is not None:
+        cert_string += f"_{sequence}"
+    # 16 hex chars, as before; BLAKE2b emits exactly the 8 bytes kept
+    return hashlib.blake2b(cert_string.encode(), digest_size=8).hexdigest().upper()
+
+@router.post("/issue", responses={200: {"model": IssueResponse}})
+def issue_certificate(
     cert_request: CertificateRequest,
     db: Session = Depends(get_db),
     current_user = Depends(get_current_institution)
@@ -147,21 +383,18 @@ async def issue_certificate(
         HTTPException: 400 for other errors
     """
     try:
-        institution_key = db.query(InstitutionKey).filter(
-            InstitutionKey.issuer_id == current_user.issuer_id
-        ).first()
-        
-        if not institution_key:
+        if not _has_institution_key(db, current_user.issuer_id):
             raise HTTPException(
                 status_code=500,
                 detail="Institution key not found. Please contact administrator."
             )
         
-        issue_date = datetime.now().strftime("%Y-%m-%d")
+        # Derive the (local) issue date from the same clock reading instead
+        # of a second datetime.now() call
         timestamp = time.time()
+        issue_date = time.strftime("%Y-%m-%d", time.localtime(timestamp))
         
-        cert_string = f"{cert_request.student_id}_{cert_request.course_name}_{timestamp}"
-        certificate_id = hashlib.sha256(cert_string.encode()).hexdigest()[:16].upper()
+        certificate_id = create_certificate_id(cert_request.student_id, cert_request.course_name, timestamp)
         
         pii_hash = create_pii_hash({
             'student_name': cert_request.student_name,
@@ -181,16 +414,15 @@ async def issue_certificate(
         if not result['success']:
             raise HTTPException(status_code=500, detail=result.get('error', result.get('message', 'Failed to issue certificate on Ethereum')))
         
-        index_entry = CertificateIndex(
-            certificate_id=certificate_id,
-            student_id=cert_request.student_id,
-            issuer_id=current_user.issuer_id,
-            course_name=cert_request.course_name,
-            timestamp=timestamp,
-            status="active"
-        )
-        db.add(index_entry)
-        db.commit()
+        _insert_index_entries(db, [{
+            "certificate_id": certificate_id,
+            "student_id": cert_request.student_id,
+            "issuer_id": current_user.issuer_id,
+            "course_name": cert_request.course_name,
+            "timestamp": timestamp,
+            "status": "active"
+        }])
+        _clear_verify_misses([certificate_id])
         
         return {
             "success": True,
@@ -226,8 +458,160 @@ async def issue_certificate(
         db.rollback()
         raise HTTPException(status_code=400, detail=str(e))
 
-@router.post("/verify")
-async def verify_certificate(
+# Upper bound on certificates per /issue-batch call, so one request can't
+# hold a worker thread and the signer's nonce sequence indefinitely
+MAX_BATCH_SIZE = 500
+
+@router.post("/issue-batch")
+def issue_certificates_batch(
+    cert_requests: List[CertificateRequest],
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_institution)
+):
+    """
+    Issue many certificates in one call (requires institution/admin authentication).
+    
+    Intended for bulk issuance (e.g. a graduating class). Compared to calling
+    /issue once per certificate, this makes one HTTP request, one institution
+    key check, submits all Ethereum transactions back to back (see
+    EthereumService.issue_certificates_batch) and writes the index entries in
+    a single commit.
+    
+    Certificates are processed in order. If a transaction can't be submitted,
+    the remaining ones are not sent; each entry in the response reports its
+    own outcome, and only successfully issued certificates are indexed. A
+    receipt that can't be fetched fails only its own entry, so every
+    certificate that was confirmed is still indexed.
+    
+    All certificates in a batch share one issue timestamp; IDs are derived
+    from it plus each entry's position. A (student_id, course_name) pair may
+    appear only once per batch.
+    
+    Args:
+        cert_requests: List of certificate data (same fields as /issue)
+        db: Database session (injected by FastAPI)
+        current_user: Authenticated institution/admin user (from dependency)
+    
+    Returns:
+        dict: Batch result with:
+            - success: True if every certificate was issued
+            - issued_count / failed_count: Outcome totals
+            - results: Per-certificate result (certificate_id, success,
+              transaction_hash, block_number or error)
+    
+    Raises:
+        HTTPException: 400 if the batch is empty, too large or contains duplicates
+        HTTPException: 500 if institution key not found
+        HTTPException: 400 for other errors
+    """
+    if not cert_requests:
+        raise HTTPException(status_code=400, detail="No certificates to issue")
+    if len(cert_requests) > MAX_BATCH_SIZE:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {MAX_BATCH_SIZE} certificates can be issued per batch"
+        )
+    
+    try:
+        if not _has_institution_key(db, current_user.issuer_id):
+            raise HTTPException(
+                status_code=500,
+                detail="Institution key not found. Please contact administrator."
+            )
+        
+        issuer_id = current_user.issuer_id
+        
+        # Duplicates are the same student and course twice in one request;
+        # checked on the input itself, not on derived IDs
+        seen = set()
+        for cert_request in cert_requests:
+            key = (cert_request.student_id, cert_request.course_name)
+            if key in seen:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Duplicate certificate in batch for student {cert_request.student_id}, course {cert_request.course_name}"
+                )
+            seen.add(key)
+        
+        # One issue time for the whole batch; the item index keeps IDs unique
+        # and deterministic regardless of the clock's resolution
+        timestamp = time.time()
+        pending = []
+        for i, cert_request in enumerate(cert_requests):
+            certificate_id = create_certificate_id(
+                cert_request.student_id, cert_request.course_name, timestamp, sequence=i
+            )
+            
+            pending.append({
+                'certificate_id': certificate_id,
+                'timestamp': timestamp,
+                'pii_hash': create_pii_hash({
+                    'student_name': cert_request.student_name,
+                    'student_id': cert_request.student_id,
+                    'grade': cert_request.grade
+                }),
+                'course_name': cert_request.course_name,
+                'issuer_id': issuer_id
+            })
+        
+        ethereum_service = get_ethereum_service()
+        chain_results = ethereum_service.issue_certificates_batch(pending)
+        
+        results = []
+        index_entries = []
+        for cert_request, cert, result in zip(cert_requests, pending, chain_results):
+            if result['success']:
+                index_entries.append({
+                    "certificate_id": cert['certificate_id'],
+                    "student_id": cert_request.student_id,
+                    "issuer_id": issuer_id,
+                    "course_name": cert_request.course_name,
+                    "timestamp": cert['timestamp'],
+                    "status": "active"
+                })
+                results.append({
+                    "certificate_id": cert['certificate_id'],
+                    "student_id": cert_request.student_id,
+                    "success": True,
+                    "transaction_hash": result.get('transaction_hash'),
+                    "block_number": result.get('block_number')
+                })
+            else:
+                failed = {
+                    "certificate_id": cert['certificate_id'],
+                    "student_id": cert_request.student_id,
+                    "success": False,
+                    "error": result.get('error', 'Failed to issue certificate on Ethereum')
+                }
+                # Sent but unconfirmed (receipt timeout): report the hash so
+                # the transaction can be checked later
+                if result.get('transaction_hash'):
+                    failed["transaction_hash"] = result['transaction_hash']
+                results.append(failed)
+        
+        if index_entries:
+            _insert_index_entries(db, index_entries)
+            _clear_verify_misses([entry["certificate_id"] for entry in index_entries])
+        
+        issued_count = len(index_entries)
+        return {
+            "success": issued_count == len(cert_requests),
+            "message": f"Issued {issued_count} of {len(cert_requests)} certificate(s) on Ethereum blockchain",
+            "issued_count": issued_count,
+            "failed_count": len(cert_requests) - issued_count,
+            "network": chain_results[0].get('network'),
+            "contract_address": chain_results[0].get('contract_address'),
+            "results": results
+        }
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.post("/verify", responses={200: {"model": VerifyResponse}})
+def verify_certificate(
     verification_request: VerificationRequest,
     db: Session = Depends(get_db)
 ):
@@ -244,6 +628,10 @@ async def verify_certificate(
     This is a PUBLIC endpoint - anyone can verify certificates without
     authentication. This enables employers and others to verify credentials.
     
+    Results are cached per worker process for VERIFY_CACHE_TTL seconds. A
+    revocation handled by another worker, or made directly on the contract,
+    can be reported as valid here until the cached entry expires.
+    
     Args:
         verification_request: Contains certificate_id to verify
         db: Database session (injected by FastAPI)
@@ -259,29 +647,41 @@ async def verify_certificate(
     Raises:
         HTTPException: 400 if an error occurs
     """
+    with _verify_cache_lock:
+        cached = _verify_cache.get(verification_request.certificate_id)
+        if cached is None:
+            cached = _verify_miss_cache.get(verification_request.certificate_id)
+    if cached is not None:
+        return cached
+    
     try:
         ethereum_service = get_ethereum_service()
         result = ethereum_service.verify_certificate_without_pii(verification_request.certificate_id)
         
         if not result['found']:
             error_message = result.get('error', 'Certificate not found')
-            return {
+            response = {
                 "verified": False,
                 "valid": False,
                 "message": error_message
             }
+            # Connection failures carry debug info and must not be cached
+            if 'debug' not in result:
+                with _verify_cache_lock:
+                    _verify_miss_cache[verification_request.certificate_id] = response
+            return response
         
-        cert_data = ethereum_service.get_certificate(verification_request.certificate_id)
-        
+        # verify_certificate_without_pii already returns the on-chain record,
+        # so no second get_certificate() lookup is needed
         certificate_info = {
             'certificate_id': verification_request.certificate_id,
             'student_name': None,
             'student_id': None,
-            'course_name': cert_data.get('course_name'),
+            'course_name': result.get('course_name'),
             'grade': None,
-            'issuer_id': cert_data.get('issuer_id'),
-            'timestamp': cert_data.get('timestamp'),
-            'status': 'revoked' if cert_data.get('revoked') else 'active'
+            'issuer_id': result.get('issuer_id'),
+            'timestamp': result.get('timestamp'),
+            'status': 'revoked' if result.get('revoked') else 'active'
         }
         
         blockchain_proof = {
@@ -294,7 +694,7 @@ async def verify_certificate(
             'contract_address': result.get('contract_address')
         }
         
-        return {
+        response = {
             "verified": True,
             "valid": result.get('valid', False),
             "certificate": certificate_info,
@@ -302,13 +702,22 @@ async def verify_certificate(
             "signature_verified": None,
             "note": "Certificate verified on Ethereum blockchain. PII (student name, ID, grade) is not stored on blockchain for privacy."
         }
+        
+        with _verify_cache_lock:
+            _verify_cache[verification_request.certificate_id] = response
+        
+        return response
     
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.get("/student/{student_id}")
-async def get_student_certificates(
+def get_student_certificates(
     student_id: str,
+    request: Request,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    offset: int = Query(0, ge=0),
+    cursor: Optional[int] = Query(None, ge=0),
     db: Session = Depends(get_db)
 ):
     """
@@ -321,37 +730,58 @@ async def get_student_certificates(
     
     Args:
         student_id: Student identifier to search for
+        request: Incoming request (for conditional GET handling)
+        limit: Maximum number of certificates to return (1-1000, default 100)
+        offset: Number of certificates to skip
+        cursor: Resume after this position (next_cursor of the previous page)
         db: Database session (injected by FastAPI)
     
     Returns:
         dict: Student certificates with:
             - student_id: The student identifier
-            - certificates: List of certificate dictionaries
-            - count: Number of certificates found
+            - certificates: List of certificate dictionaries (this page)
+            - count: Number of certificates in this page
+            - limit / offset: Paging parameters used
+            - has_more: True if another page follows
+            - next_cursor: Pass as cursor to fetch the next page (None on the last page)
     
     Raises:
         HTTPException: 400 if an error occurs
     """
     try:
-        index_entries = db.query(CertificateIndex).filter(
-            CertificateIndex.student_id == student_id,
-            CertificateIndex.status == "active"
-        ).all()
+        index_entries, has_more, next_cursor = _fetch_page(
+            db.query(*_LISTING_COLUMNS).filter(
+                CertificateIndex.student_id == student_id,
+                CertificateIndex.status == "active"
+            ),
+            limit,
+            offset,
+            cursor
+        )
         
         if not index_entries:
-            return {
+            return cached_json_response(request, {
                 "student_id": student_id,
                 "certificates": [],
                 "count": 0,
+                "limit": limit,
+                "offset": offset,
+                "has_more": False,
+                "next_cursor": None,
                 "note": f"No certificates found for Student ID: {student_id}. Certificates are stored on Ethereum blockchain and must be verified individually by certificate ID."
-            }
+            }, cache_control=LIST_CACHE_CONTROL)
         
         ethereum_service = get_ethereum_service()
         certificates = []
         
+        # All on-chain lookups for this page are made concurrently
+        chain_records = ethereum_service.get_certificates_batch(
+            [index_entry.certificate_id for index_entry in index_entries]
+        )
+        
         for index_entry in index_entries:
             try:
-                cert_data = ethereum_service.get_certificate(index_entry.certificate_id)
+                cert_data = chain_records[index_entry.certificate_id]
                 if cert_data and (cert_data.get('exists') == True or cert_data.get('found') == True):
                     certificates.append({
                         "certificate_id": index_entry.certificate_id,
@@ -393,18 +823,23 @@ async def get_student_certificates(
                     "note": f"Certificate exists in index but could not be verified on Ethereum: {str(e)}"
                 })
         
-        return {
+        return cached_json_response(request, {
             "student_id": student_id,
             "certificates": certificates,
             "count": len(certificates),
+            "limit": limit,
+            "offset": offset,
+            "has_more": has_more,
+            "next_cursor": next_cursor,
             "note": f"Found {len(certificates)} certificate(s). Full certificate data is stored on Ethereum blockchain. Use certificate ID to verify in 'Verify Certificate' tab."
-        }
+        }, cache_control=LIST_CACHE_CONTROL)
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.get("/issuer/{issuer_id}")
-async def get_issuer_certificates(
+def get_issuer_certificates(
     issuer_id: str,
+    request: Request,
     db: Session = Depends(get_db)
 ):
     """
@@ -417,6 +852,7 @@ async def get_issuer_certificates(
     
     Args:
         issuer_id: Institution identifier to search for
+        request: Incoming request (for conditional GET handling)
         db: Database session (injected by FastAPI)
     
     Returns:
@@ -429,17 +865,17 @@ async def get_issuer_certificates(
         HTTPException: 400 if an error occurs
     """
     try:
-        return {
+        return cached_json_response(request, {
             "issuer_id": issuer_id,
             "certificates": [],
             "count": 0,
             "note": "Ethereum blockchain doesn't support querying certificates by issuer_id. Please verify certificates individually by certificate_id."
-        }
+        }, cache_control=LIST_CACHE_CONTROL)
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-@router.post("/revoke")
-async def revoke_certificate(
+@router.post("/revoke", responses={200: {"model": RevokeResponse}})
+def revoke_certificate(
     revocation_request: RevocationRequest,
     db: Session = Depends(get_db),
     current_user = Depends(get_current_institution)
@@ -475,20 +911,27 @@ async def revoke_certificate(
     """
     try:
         ethereum_service = get_ethereum_service()
-        cert_data = ethereum_service.get_certificate(revocation_request.certificate_id)
-        
-        if not cert_data or cert_data.get('found') == False:
-            raise HTTPException(status_code=404, detail="Certificate not found on Ethereum blockchain")
-        
-        if cert_data.get('revoked'):
-            raise HTTPException(status_code=400, detail="Certificate is already revoked")
         
-        result = ethereum_service.revoke_certificate(
-            revocation_request.certificate_id,
-            revocation_request.reason or "Revoked by issuer"
-        )
+        # No pre-flight read: revokeCertificate require()s that the
+        # certificate exists and isn't revoked yet, and gas estimation
+        # surfaces those reverts before anything is sent
+        try:
+            result = ethereum_service.revoke_certificate(
+                revocation_request.certificate_id,
+                revocation_request.reason or "Revoked by issuer"
+            )
+        except Exception as e:
+            error_msg = str(e)
+            if 'Certificate does not exist' in error_msg:
+                raise HTTPException(status_code=404, detail="Certificate not found on Ethereum blockchain")
+            if 'Certificate already revoked' in error_msg:
+                raise HTTPException(status_code=400, detail="Certificate is already revoked")
+            raise
         
         if result['success']:
+            with _verify_cache_lock:
+                _verify_cache.pop(revocation_request.certificate_id, None)
+            
             index_entry = db.query(CertificateIndex).filter(
                 CertificateIndex.certificate_id == revocation_request.certificate_id
             ).first()
@@ -513,7 +956,13 @@ async def revoke_certificate(
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.get("/all")
-async def get_all_certificates(db: Session = Depends(get_db)):
+def get_all_certificates(
+    request: Request,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    offset: int = Query(0, ge=0),
+    cursor: Optional[int] = Query(None, ge=0),
+    db: Session = Depends(get_db)
+):
     """
     Get all certificates from the index with their Ethereum verification status.
     
@@ -521,13 +970,26 @@ async def get_all_certificates(db: Session = Depends(get_db)):
     their status on Ethereum blockchain. Useful for viewing all certificates
     and their verification status.
     
+    The index is authoritative for the revoked bit once it is set: revocation
+    is final on the contract, and the index is only marked revoked after the
+    revoke transaction succeeded. Rows with status 'revoked' are therefore
+    reported as verified and revoked without an Ethereum lookup (the on-chain
+    revocation reason is not shown for them, as the index doesn't store it).
+    
     Args:
+        request: Incoming request (for conditional GET handling)
+        limit: Maximum number of certificates to return (1-1000, default 100)
+        offset: Number of certificates to skip
+        cursor: Resume after this position (next_cursor of the previous page)
         db: Database session (injected by FastAPI)
     
     Returns:
         dict: All certificates with:
-            - certificates: List of all certificate dictionaries with Ethereum status
-            - count: Total number of certificates
+            - certificates: List of certificate dictionaries with Ethereum status (this page)
+            - count: Number of certificates in this page
+            - limit / offset: Paging parameters used
+            - has_more: True if another page follows
+            - next_cursor: Pass as cursor to fetch the next page (None on the last page)
             - verified_count: Number of certificates verified on Ethereum
             - not_verified_count: Number of certificates not found on Ethereum
     
@@ -535,16 +997,20 @@ async def get_all_certificates(db: Session = Depends(get_db)):
         HTTPException: 400 if an error occurs
     """
     try:
-        index_entries = db.query(CertificateIndex).all()
+        index_entries, has_more, next_cursor = _fetch_page(db.query(*_LISTING_COLUMNS), limit, offset, cursor)
         
         if not index_entries:
-            return {
+            return cached_json_response(request, {
                 "certificates": [],
                 "count": 0,
+                "limit": limit,
+                "offset": offset,
+                "has_more": False,
+                "next_cursor": None,
                 "verified_count": 0,
                 "not_verified_count": 0,
                 "note": "No certificates found in the index. Certificates will be added when you issue them."
-            }
+            }, cache_control=LIST_CACHE_CONTROL)
         
         certificates = []
         verified_count = 0
@@ -557,6 +1023,14 @@ async def get_all_certificates(db: Session = Depends(get_db)):
             ethereum_connected = False
             ethereum_error = str(e)
         
+        if ethereum_connected:
+            # All on-chain lookups for this page are made concurrently;
+            # revoked rows are answered from the index and not looked up
+            chain_records = ethereum_service.get_certificates_batch(
+                [index_entry.certificate_id for index_entry in index_entries
+                 if index_entry.status != 'revoked']
+            )
+        
         for index_entry in index_entries:
             cert_info = {
                 "certificate_id": index_entry.certificate_id,
@@ -565,12 +1039,19 @@ async def get_all_certificates(db: Session = Depends(get_db)):
                 "issuer_id": index_entry.issuer_id,
                 "timestamp": index_entry.timestamp,
                 "status": index_entry.status,
-                "created_at": index_entry.created_at.isoformat() if index_entry.created_at else None
+                "created_at": index_entry.created_at  # serialized to ISO 8601 by orjson
             }
             
+            # Revocation is final, so the index is trusted for the revoked bit
+            if index_entry.status == 'revoked':
+                cert_info.update(blockchain_verified=True, blockchain_revoked=True)
+                verified_count += 1
+                certificates.append(cert_info)
+                continue
+            
             if ethereum_connected:
                 try:
-                    cert_data = ethereum_service.get_certificate(index_entry.certificate_id)
+                    cert_data = chain_records[index_entry.certificate_id]
                     if cert_data and (cert_data.get('exists') == True or cert_data.get('found') == True):
                         cert_info["blockchain_verified"] = True
                         cert_info["blockchain_course_name"] = cert_data.get('course_name')
@@ -595,13 +1076,81 @@ async def get_all_certificates(db: Session = Depends(get_db)):
             
             certificates.append(cert_info)
         
-        return {
+        return cached_json_response(request, {
             "certificates": certificates,
             "count": len(certificates),
+            "limit": limit,
+            "offset": offset,
+            "has_more": has_more,
+            "next_cursor": next_cursor,
             "verified_count": verified_count,
             "not_verified_count": not_verified_count,
             "ethereum_connected": ethereum_connected,
             "note": f"Found {len(certificates)} certificate(s) in index. {verified_count} verified on Ethereum, {not_verified_count} not found or error."
-        }
+        }, cache_control=LIST_CACHE_CONTROL)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/stats")
+def get_certificate_stats(request: Request, db: Session = Depends(get_db)):
+    """
+    Get certificate counts from the index (public endpoint).
+    
+    Answered with a single aggregate query and no Ethereum lookups, for
+    dashboards that only need totals. Status comes from the index, which is
+    updated when certificates are revoked through this API; use /all for
+    per-certificate on-chain status.
+    
+    Args:
+        request: Incoming request (for conditional GET handling)
+        db: Database session (injected by FastAPI)
+    
+    Returns:
+        dict: Counts with:
+            - total: Number of indexed certificates
+            - active: Number of active certificates
+            - revoked: Number of revoked certificates
+    
+    Raises:
+        HTTPException: 400 if an error occurs
+    """
+    try:
+        total, active, revoked = db.query(
+            func.count(CertificateIndex.id),
+            func.coalesce(func.sum(case((CertificateIndex.status == "active", 1), else_=0)), 0),
+            func.coalesce(func.sum(case((CertificateIndex.status == "revoked", 1), else_=0)), 0)
+        ).one()
+        
+        return cached_json_response(request, {
+            "total": total,
+            "active": active,
+            "revoked": revoked
+        }, cache_control=LIST_CACHE_CONTROL)
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
+
+@router.delete("/verify-cache")
+def clear_verify_cache(current_user = Depends(get_current_active_admin)):
+    """
+    Flush the /verify result cache (admin only).
+    
+    Useful after revocations made directly on the contract, which this API
+    can't observe until cached entries expire. The cache is per process, so
+    this only clears the worker that serves the request; other workers keep
+    their entries for at most VERIFY_CACHE_TTL seconds.
+    
+    Args:
+        current_user: Authenticated admin user (from dependency)
+    
+    Returns:
+        dict: Number of cached verification results that were dropped
+    """
+    with _verify_cache_lock:
+        cleared = len(_verify_cache) + len(_verify_miss_cache)
+        _verify_cache.clear()
+        _verify_miss_cache.clear()
+    
+    return {
+        "success": True,
+        "cleared": cleared
+    }
@@ -0,0 +1,77 @@
+"""
+Application Settings Module
+
+This module collects the environment-driven settings used to configure the
+database engine, the FastAPI application and password hashing, so they are read in one place
+instead of through scattered os.getenv calls.
+
+It includes:
+- Settings: immutable container for the configuration values
+- get_settings(): reads the environment once per process and caches the result
+
+Note:
+    main.py calls load_dotenv() before the routers (and therefore the
+    database module) are imported, so values from backend/.env are visible
+    on the first get_settings() call.
+"""
+
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Tuple
+
+@dataclass(frozen=True)
+class Settings:
+    """
+    Environment-driven application settings.
+    
+    Attributes:
+        database_url: SQLAlchemy database URL (SQLite for dev, PostgreSQL for production)
+        db_pool_size: Persistent connections in the PostgreSQL pool
+        db_max_overflow: Extra connections allowed above db_pool_size under load
+        cors_origins: Origins allowed to call the API from a browser
+        argon2_time_cost: Argon2id iterations per password hash
+        argon2_memory_cost: Argon2id memory per password hash, in KiB
+        argon2_parallelism: Argon2id lanes per password hash
+    """
+    database_url: str
+    db_pool_size: int
+    db_max_overflow: int
+    cors_origins: Tuple[str, ...]
+    argon2_time_cost: int
+    argon2_memory_cost: int
+    argon2_parallelism: int
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Read application settings from the environment.
+    
+    The environment is parsed once; later calls return the same cached
+    Settings instance.
+    
+    Environment variables:
+        DATABASE_URL: Database URL (default: sqlite:///./certificates.db)
+        DB_POOL_SIZE: PostgreSQL pool size (default: 20)
+        DB_MAX_OVERFLOW: PostgreSQL pool overflow (default: 20)
+        CORS_ORIGINS: Comma-separated allowed origins (default: "*")
+        ARGON2_TIME_COST: Argon2id iterations (default: 3)
+        ARGON2_MEMORY_COST: Argon2id memory in KiB (default: 47104, i.e. 46 MiB)
+        ARGON2_PARALLELISM: Argon2id lanes (default: 1)
+    
+    Returns:
+        Settings: The application settings
+    """
+    return Settings(
+        database_url=os.getenv("DATABASE_URL", "sqlite:///./certificates.db"),
+        db_pool_size=int(os.getenv("DB_POOL_SIZE", "20")),
+        db_max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "20")),
+        cors_origins=tuple(
+            origin.strip()
+            for origin in os.getenv("CORS_ORIGINS", "*").split(",")
+            if origin.strip()
+        ),
+        argon2_time_cost=int(os.getenv("ARGON2_TIME_COST", "3")),
+        argon2_memory_cost=int(os.getenv("ARGON2_MEMORY_COST", str(46 * 1024))),
+        argon2_parallelism=int(os.getenv("ARGON2_PARALLELISM", "1")),
+    )
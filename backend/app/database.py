@@ -8,18 +8,71 @@ This module handles all database-related configuration including:
 - Database initialization (table creation)
 """
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-import os
+from sqlalchemy.pool import StaticPool
+from .config import get_settings
 
-DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./certificates.db")
+settings = get_settings()
+
+DATABASE_URL = settings.database_url
+
+if "sqlite" in DATABASE_URL:
+    # SQLite (development): sessions are used from FastAPI's threadpool
+    engine_options = {"connect_args": {"check_same_thread": False}}
+    # An in-memory database only exists inside one connection, so share it
+    if ":memory:" in DATABASE_URL or DATABASE_URL == "sqlite://":
+        engine_options["poolclass"] = StaticPool
+else:
+    # PostgreSQL (production): the default pool (5 + 10 overflow) is
+    # exhausted quickly under concurrent requests and surfaces as
+    # "QueuePool limit reached" timeouts. At most 40 connections per worker
+    # keeps a couple of uvicorn workers under PostgreSQL's default
+    # max_connections (100). Override DB_POOL_SIZE / DB_MAX_OVERFLOW to
+    # match the worker count and the server's connection limit.
+    engine_options = {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": 30,
+        # LIFO hands out the most recently used connection, so a few warm
+        # connections serve steady traffic and idle overflow ones can be
+        # retired instead of being rotated through
+        "pool_use_lifo": True,
+        "pool_pre_ping": True,  # Detect connections dropped by the server/proxy
+        "pool_recycle": 1800,  # Retire connections before proxy/LB idle cutoffs
+    }
 
 engine = create_engine(
     DATABASE_URL,
-    connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {}
+    query_cache_size=1200,  # Compiled SQL statement cache (default 500)
+    **engine_options
 )
 
+if "sqlite" in DATABASE_URL and ":memory:" not in DATABASE_URL and DATABASE_URL != "sqlite://":
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """
+        Configure every new SQLite connection.
+        
+        WAL lets readers proceed while a write is in flight (the default
+        rollback journal blocks them); synchronous=NORMAL is durable under
+        WAL except for the last commits on power loss, and avoids an fsync
+        per commit.
+        
+        busy_timeout makes SQLite wait (up to 30 s) for a competing writer's
+        lock instead of failing immediately with "database is locked".
+        cache_size is negative, so it is in KiB: a 64 MB page cache per
+        connection. temp_store=MEMORY keeps sort/temp tables off disk.
+        """
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA busy_timeout=30000")
+        cursor.execute("PRAGMA cache_size=-64000")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
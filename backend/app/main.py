@@ -13,33 +13,45 @@ The application provides:
 - Privacy-preserving certificate verification
 """
 
+from anyio import to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
-import os
+from fastapi.responses import ORJSONResponse, Response
+import orjson
 from dotenv import load_dotenv
 
 load_dotenv()
 
 from .api import certificates, blockchain, auth
 
+from .config import get_settings
 from .database import init_db
 
 app = FastAPI(
     title="Certificate Validation System",
     description="A blockchain-based system for issuing and verifying academic certificates",
-    version="1.0.0"
+    version="1.0.0",
+    # orjson serializes responses several times faster than the stdlib json
+    default_response_class=ORJSONResponse
 )
 
+# Allowed frontend origins come from CORS_ORIGINS (comma-separated), e.g.
+# CORS_ORIGINS=http://localhost:3000,https://certs.example.edu
+# Unset keeps the permissive development default.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=list(get_settings().cors_origins),
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    # Explicit lists instead of wildcards: only what the frontend sends
+    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+    allow_headers=["Authorization", "Content-Type", "If-None-Match"],
 )
 
+# Worker threads available to sync (`def`) endpoints. Password hashing and
+# blocking database calls hold a thread each, so the anyio default of 40
+# is too small under bursts of logins.
+THREADPOOL_SIZE = 200
+
 @app.on_event("startup")
 async def startup_event():
     """
@@ -47,13 +59,19 @@ async def startup_event():
     
     This function runs once when the FastAPI application starts.
     It initializes the database by creating all necessary tables
-    if they don't already exist.
+    if they don't already exist, and sizes the threadpool used for
+    sync endpoints.
+    
+    Table creation is blocking I/O, so it runs in a worker thread rather
+    than on the event loop. Startup still waits for it, so no request is
+    served before the tables exist.
     
     Note:
         - Safe to call multiple times (idempotent)
         - Only creates missing tables, doesn't modify existing ones
     """
-    init_db()
+    to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    await to_thread.run_sync(init_db)
 
 app.include_router(auth.router)
 
@@ -80,6 +98,10 @@ async def root():
         }
     }
 
+# The health payload never changes, so it is serialized once at import
+# rather than on every probe
+_HEALTH_BODY = orjson.dumps({"status": "healthy", "message": "API is running"})
+
 @app.get("/health")
 async def health_check():
     """
@@ -87,11 +109,14 @@ async def health_check():
     
     This endpoint can be used by monitoring tools, load balancers, or
     orchestration systems to check if the API is running and healthy.
+    It has no dependencies and never touches the database, so it stays
+    responsive on the event loop even when the threadpool or the
+    connection pool is saturated.
     
     Returns:
-        dict: Health status information
+        Response: Pre-serialized JSON health status
     """
-    return {"status": "healthy", "message": "API is running"}
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 if __name__ == "__main__":
     import uvicorn
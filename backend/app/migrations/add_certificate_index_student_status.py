@@ -0,0 +1,62 @@
+"""
+Migration script to add the (student_id, status, id) index on certificate_index.
+
+New databases get this index from the CertificateIndex model through
+init_db(); create_all() does not add indexes to tables that already exist,
+so existing databases need this script. It also drops the indexes the
+composite one supersedes: the earlier (student_id, status) index and the
+single-column student_id index.
+
+Run this script once:
+    python -m app.migrations.add_certificate_index_student_status
+"""
+
+import os
+import sys
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError, ProgrammingError
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from app.database import DATABASE_URL
+
+INDEX_NAME = "ix_certificate_index_student_status_id"
+
+# Indexes that are redundant once INDEX_NAME exists (same leading columns)
+SUPERSEDED_INDEXES = ["ix_certificate_index_student_status", "ix_certificate_index_student_id"]
+
+def add_certificate_index_student_status():
+    """Create the composite (student_id, status, id) index and drop superseded ones."""
+    
+    print("=" * 80)
+    print("Adding certificate_index (student_id, status, id) Index")
+    print("=" * 80)
+    print()
+    
+    # Create engine
+    engine = create_engine(DATABASE_URL)
+    
+    with engine.connect() as conn:
+        try:
+            # IF NOT EXISTS is supported by both SQLite and PostgreSQL
+            conn.execute(text(
+                f"CREATE INDEX IF NOT EXISTS {INDEX_NAME} "
+                "ON certificate_index (student_id, status, id)"
+            ))
+            for old_index in SUPERSEDED_INDEXES:
+                conn.execute(text(f"DROP INDEX IF EXISTS {old_index}"))
+            conn.commit()
+            print(f"✅ Index {INDEX_NAME} is in place")
+            print(f"✅ Dropped superseded indexes: {', '.join(SUPERSEDED_INDEXES)}")
+        except (OperationalError, ProgrammingError) as e:
+            print(f"⚠️  Error creating index {INDEX_NAME}: {e}")
+            print("   Make sure the certificate_index table exists (start the app once to create it).")
+    
+    print()
+    print("=" * 80)
+    print("Migration Complete!")
+    print("=" * 80)
+
+if __name__ == "__main__":
+    add_certificate_index_student_status()
@@ -10,7 +10,7 @@ Run this script once to clean up the database:
 
 import os
 import sys
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, inspect, text
 from sqlalchemy.exc import OperationalError
 
 # Add parent directory to path
@@ -29,36 +29,31 @@ def remove_custom_blockchain_tables():
     # Create engine
     engine = create_engine(DATABASE_URL)
     
-    with engine.connect() as conn:
-        # Check if tables exist and remove them
-        tables_to_remove = ['blockchain_entries', 'blocks']
-        
-        for table_name in tables_to_remove:
-            try:
-                # Check if table exists (SQLite specific)
-                if 'sqlite' in DATABASE_URL:
-                    result = conn.execute(text(
-                        f"SELECT name FROM sqlite_master WHERE type='table' AND name='{table_name}'"
-                    ))
-                    exists = result.fetchone() is not None
-                else:
-                    # PostgreSQL
-                    result = conn.execute(text(
-                        f"SELECT EXISTS (SELECT FROM information_schema.tables WHERE table_name = '{table_name}')"
-                    ))
-                    exists = result.fetchone()[0]
-                
-                if exists:
+    # Check which tables exist with one reflection call instead of a
+    # per-table catalog query (works for SQLite and PostgreSQL alike)
+    tables_to_remove = ['blockchain_entries', 'blocks']
+    existing_tables = set(inspect(engine).get_table_names())
+    
+    for table_name in tables_to_remove:
+        if table_name not in existing_tables:
+            print(f"ℹ️  Table {table_name} does not exist (already removed or never created)")
+    
+    to_drop = [name for name in tables_to_remove if name in existing_tables]
+    if to_drop:
+        try:
+            # All drops in one transaction; blockchain_entries goes first
+            # because it references blocks
+            with engine.begin() as conn:
+                for table_name in to_drop:
                     print(f"Removing table: {table_name}...")
                     conn.execute(text(f"DROP TABLE IF EXISTS {table_name}"))
-                    conn.commit()
-                    print(f"✅ Removed table: {table_name}")
-                else:
-                    print(f"ℹ️  Table {table_name} does not exist (already removed or never created)")
-                    
-            except OperationalError as e:
-                print(f"⚠️  Error removing table {table_name}: {e}")
-                print("   This is okay if the table doesn't exist.")
+            for table_name in to_drop:
+                print(f"✅ Removed table: {table_name}")
+        except OperationalError as e:
+            print(f"⚠️  Error removing tables {', '.join(to_drop)}: {e}")
+            print("   No tables were removed; the transaction was rolled back.")
+    
+    engine.dispose()
     
     print()
     print("=" * 80)
@@ -18,7 +18,7 @@ Database Design:
 - Relationships link certificates to users and signatures
 """
 
-from sqlalchemy import Column, Integer, String, Float, Text, Boolean, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, Float, Text, Boolean, ForeignKey, DateTime, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from ..database import Base
@@ -41,7 +41,7 @@ class User(Base):
         id: Primary key
         username: Unique username for login
         email: Unique email address
-        hashed_password: Bcrypt-hashed password (never store plain text!)
+        hashed_password: Argon2id password hash (never store plain text!)
         role: User role (admin, institution, student)
         issuer_id: For institutions - unique identifier
         issuer_name: For institutions - institution name
@@ -60,7 +60,7 @@ class User(Base):
     email = Column(String(255), unique=True, index=True, nullable=False)
     
     # Authentication
-    hashed_password = Column(String(255), nullable=False)  # Bcrypt hash
+    hashed_password = Column(String(255), nullable=False)  # Argon2id hash (legacy accounts: bcrypt)
     
     # Role and permissions
     role = Column(String(50), nullable=False, default="student")  # admin, institution, student
@@ -81,7 +81,7 @@ class User(Base):
         back_populates="issuer_user", 
         foreign_keys="CertificateDB.issuer_user_id"
     )
-    private_keys = relationship("InstitutionKey", back_populates="user")
+    private_keys = relationship("InstitutionKey", back_populates="user", lazy="raise_on_sql")
 
 # ============================================================================
 # Institution Key Model
@@ -131,7 +131,7 @@ class InstitutionKey(Base):
     
     # Relationships
     user = relationship("User", back_populates="private_keys")
-    signatures = relationship("CertificateSignature", back_populates="key")
+    signatures = relationship("CertificateSignature", back_populates="key", lazy="raise_on_sql")
 
 # ============================================================================
 # Certificate Model (Private Database Storage)
@@ -147,7 +147,7 @@ class CertificateDB(Base):
     
     Privacy Design:
         - Full certificate data stored here (private database)
-        - Only hash of PII stored on blockchain (BlockchainEntry)
+        - Only hash of PII stored on blockchain (Ethereum contract)
         - Allows verification without exposing personal information
     
     Fields:
@@ -169,7 +169,6 @@ class CertificateDB(Base):
     
     Relationships:
         issuer_user: User who issued this certificate
-        blockchain_entry: Corresponding entry on blockchain (hash only)
         signature: Digital signature for this certificate
     """
     __tablename__ = "certificates"
@@ -205,9 +204,13 @@ class CertificateDB(Base):
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
-    # Relationships
-    issuer_user = relationship("User", foreign_keys=[issuer_user_id])
-    signature = relationship("CertificateSignature", back_populates="certificate", uselist=False)
+    # Relationships. Lazy loading would issue one query per row when a list
+    # of certificates is walked (N+1), so it raises instead; queries that
+    # need these must load them explicitly with joinedload()/selectinload().
+    issuer_user = relationship("User", foreign_keys=[issuer_user_id], lazy="raise_on_sql")
+    signature = relationship(
+        "CertificateSignature", back_populates="certificate", uselist=False, lazy="raise_on_sql"
+    )
 
 # ============================================================================
 # Certificate Index Model (Lightweight mapping for Ethereum-only mode)
@@ -228,7 +231,7 @@ class CertificateIndex(Base):
     Fields:
         id: Primary key
         certificate_id: Unique certificate identifier (indexed)
-        student_id: Student identifier (indexed for fast lookup)
+        student_id: Student identifier (leads the composite listing index)
         issuer_id: Institution identifier (indexed for fast lookup)
         course_name: Course name (for display purposes only, not PII)
         timestamp: Unix timestamp of issuance
@@ -243,7 +246,7 @@ class CertificateIndex(Base):
     certificate_id = Column(String(100), unique=True, index=True, nullable=False)
     
     # Index fields (for querying)
-    student_id = Column(String(100), index=True, nullable=False)
+    student_id = Column(String(100), nullable=False)  # See __table_args__
     issuer_id = Column(String(100), index=True, nullable=False)
     
     # Minimal display data (not PII)
@@ -255,6 +258,14 @@ class CertificateIndex(Base):
     
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    # get_student_certificates filters on student_id AND status and pages in
+    # id order (keyset cursor); with id as the last key the index returns the
+    # rows already sorted, so no sort step is needed. It also serves any
+    # student_id-only lookup, so student_id has no separate index.
+    __table_args__ = (
+        Index("ix_certificate_index_student_status_id", "student_id", "status", "id"),
+    )
 
 # ============================================================================
 # Block and BlockchainEntry Models - REMOVED
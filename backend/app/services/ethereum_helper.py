@@ -4,12 +4,27 @@ Provides a single point of configuration for Ethereum service.
 """
 
 import os
+from functools import lru_cache
 from .ethereum_service import EthereumService
 
+@lru_cache(maxsize=4)
+def _create_ethereum_service(contract_address: str, private_key: str) -> EthereumService:
+    """
+    Create (once per configuration) the EthereumService instance.
+    
+    Building the service connects to the node and checks the contract code,
+    which costs several RPC round trips, so instances are reused across
+    requests. Failed constructions raise and are not cached.
+    """
+    return EthereumService(contract_address, private_key)
+
 def get_ethereum_service(require_private_key: bool = False) -> EthereumService:
     """
     Get EthereumService instance with configuration from environment variables.
     
+    The instance is shared between requests (see _create_ethereum_service);
+    a new one is only created if the configuration changes.
+    
     Args:
         require_private_key: If True, raises error if private key is not set.
                            If False, allows read-only operations without private key.
@@ -29,5 +44,4 @@ def get_ethereum_service(require_private_key: bool = False) -> EthereumService:
     if require_private_key and not private_key:
         raise ValueError("ETHEREUM_PRIVATE_KEY environment variable is required for write operations")
     
-    return EthereumService(contract_address, private_key)
-
+    return _create_ethereum_service(contract_address, private_key)
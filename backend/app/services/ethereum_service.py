@@ -6,13 +6,52 @@ It replaces the custom blockchain service for Ethereum-based deployments.
 """
 
 from web3 import Web3
+from requests import Session
+from requests.adapters import HTTPAdapter
 from web3.exceptions import TransactionNotFound, BlockNotFound
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 import json
 import os
+import threading
+import time
 from eth_account import Account
+from cachetools import LRUCache, TTLCache
 from eth_utils import to_hex, to_bytes
 
+# Seconds a get_network_info() snapshot is served from memory. Blocks arrive
+# every ~2-12 s, so a few seconds of staleness is invisible to clients.
+NETWORK_INFO_TTL = 3
+
+# Seconds the last good snapshot may still be served if the node errors
+NETWORK_INFO_STALE_TTL = 30
+
+# Seconds a get_certificate() result is served from memory. Issue and revoke
+# through this API invalidate entries; the TTL bounds staleness for changes
+# made directly on the contract.
+CERTIFICATE_CACHE_TTL = 30
+
+# Keep-alive connections held open to the RPC node. web3's default session
+# pools 10 per host, fewer than the threads that may call the node at once
+# (RPC pool below plus request threads), so extra calls reconnected.
+RPC_HTTP_POOL_SIZE = 32
+
+# Small shared pool for issuing independent RPC calls concurrently
+_rpc_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="eth-rpc")
+
+# One lock per sending account, held from reading the nonce until the
+# transaction is submitted. Requests run on many threads (and a service may be
+# re-created on config changes), so without it a concurrent /issue, /revoke
+# and /issue-batch could read the same nonce and replace each other's
+# transactions.
+_sender_locks: Dict[str, threading.Lock] = {}
+_sender_locks_guard = threading.Lock()
+
+def _sender_lock(address: str) -> threading.Lock:
+    """Return the process-wide transaction submission lock for an account."""
+    with _sender_locks_guard:
+        return _sender_locks.setdefault(address, threading.Lock())
+
 
 class EthereumService:
     """
@@ -36,7 +75,11 @@ class EthereumService:
         network = os.getenv("ETHEREUM_NETWORK", "sepolia")
         rpc_url = self._get_rpc_url(network)
         
-        self.web3 = Web3(Web3.HTTPProvider(rpc_url))
+        session = Session()
+        adapter = HTTPAdapter(pool_connections=RPC_HTTP_POOL_SIZE, pool_maxsize=RPC_HTTP_POOL_SIZE)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        self.web3 = Web3(Web3.HTTPProvider(rpc_url, session=session))
         
         if not self.web3.is_connected():
             raise ConnectionError(f"Failed to connect to Ethereum {network} network at {rpc_url}")
@@ -58,6 +101,16 @@ class EthereumService:
             abi=self.contract_abi
         )
         
+        self._network_info = None
+        self._network_info_at = 0.0
+        self._network_info_lock = threading.Lock()
+        
+        self._certificate_cache = TTLCache(maxsize=8192, ttl=CERTIFICATE_CACHE_TTL)
+        # Revocation is final and the contract has no way to edit a revoked
+        # record, so revoked certificates are cached without expiry
+        self._revoked_certificate_cache = LRUCache(maxsize=65536)
+        self._certificate_cache_lock = threading.Lock()
+        
         self.account = None
         if private_key:
             self.account = Account.from_key(private_key)
@@ -169,6 +222,44 @@ class EthereumService:
         hash_bytes = Web3.keccak(data)
         return hash_bytes[:32]
     
+    def _send_transaction(self, function):
+        """
+        Sign and send a contract transaction and wait for its receipt.
+        
+        Gas estimate, gas price and chain id are independent RPC calls, so
+        they are requested concurrently. The nonce is read ('pending', so
+        transactions still in the mempool are counted) and the transaction
+        submitted under the sender's lock, which batch issuance holds too;
+        the receipt is awaited after the lock is released.
+        
+        Args:
+            function: Bound contract function (e.g. contract.functions.issueCertificate(...))
+            
+        Returns:
+            Transaction receipt
+        """
+        gas_future = _rpc_executor.submit(function.estimate_gas, {'from': self.sender_address})
+        gas_price_future = _rpc_executor.submit(lambda: self.web3.eth.gas_price)
+        chain_id_future = _rpc_executor.submit(lambda: self.web3.eth.chain_id)
+        gas = int(gas_future.result() * 1.2)
+        gas_price = gas_price_future.result()
+        chain_id = chain_id_future.result()
+        
+        with _sender_lock(self.sender_address):
+            transaction = function.build_transaction({
+                'from': self.sender_address,
+                'gas': gas,
+                'gasPrice': gas_price,
+                'nonce': self.web3.eth.get_transaction_count(self.sender_address, 'pending'),
+                'chainId': chain_id,
+            })
+            
+            signed_txn = self.web3.eth.account.sign_transaction(transaction, self.account.key)
+            
+            tx_hash = self.web3.eth.send_raw_transaction(signed_txn.raw_transaction)
+        
+        return self.web3.eth.wait_for_transaction_receipt(tx_hash)
+    
     def issue_certificate(
         self,
         certificate_id: str,
@@ -201,20 +292,8 @@ class EthereumService:
             issuer_id
         )
         
-        gas_estimate = function.estimate_gas({'from': self.sender_address})
-        
-        transaction = function.build_transaction({
-            'from': self.sender_address,
-            'gas': int(gas_estimate * 1.2),
-            'gasPrice': self.web3.eth.gas_price,
-            'nonce': self.web3.eth.get_transaction_count(self.sender_address),
-        })
-        
-        signed_txn = self.web3.eth.account.sign_transaction(transaction, self.account.key)
-        
-        tx_hash = self.web3.eth.send_raw_transaction(signed_txn.raw_transaction)
-        
-        receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash)
+        receipt = self._send_transaction(function)
+        self.invalidate_cache(certificate_id)
         
         if receipt.status != 1:
             return {
@@ -237,92 +316,173 @@ class EthereumService:
             'network': self.network
         }
     
-    def verify_certificate_without_pii(self, certificate_id: str) -> Dict[str, Any]:
+    def issue_certificates_batch(self, certificates: List[Dict[str, str]]) -> List[Dict[str, Any]]:
         """
-        Verify a certificate on Ethereum blockchain without requiring PII hash.
-        Retrieves PII hash from blockchain first.
+        Issue several certificates on Ethereum blockchain in one pipelined pass.
+        
+        The contract only has a single-certificate issueCertificate, so each
+        certificate is still its own transaction. Gas price and the starting
+        nonce are fetched once, all transactions are signed and submitted back
+        to back with consecutive nonces, and receipts are awaited only after
+        every transaction is in the mempool, so they can be mined together
+        instead of one block per certificate. Gas is estimated for all
+        certificates concurrently before submission; only reading the nonce
+        and signing/sending hold the sender's lock (shared with
+        _send_transaction), so no other transaction can take one of the
+        batch's nonces.
+        
+        A receipt that cannot be fetched (timeout, RPC error) only fails its
+        own item: the other transactions were already sent and must still be
+        reported so the caller can index them.
         
         Args:
-            certificate_id: Unique certificate identifier
+            certificates: List of dicts with certificate_id, pii_hash,
+                course_name and issuer_id (same fields as issue_certificate)
             
         Returns:
-            dict: Verification result with 'found' field indicating if certificate exists
+            list: One result dict per certificate, in input order, shaped
+                like issue_certificate's result
         """
-        try:
-            cert_id_bytes32 = self.bytes32_hash(certificate_id)
-            exists = self.contract.functions.certificateExists(cert_id_bytes32).call()
+        if not self.account:
+            raise ValueError("Private key required for issuing certificates")
+        
+        gas_price_future = _rpc_executor.submit(lambda: self.web3.eth.gas_price)
+        chain_id_future = _rpc_executor.submit(lambda: self.web3.eth.chain_id)
+        
+        # Build every call and estimate its gas concurrently, before taking
+        # the sender lock, so other issues/revokes aren't held up behind up
+        # to MAX_BATCH_SIZE estimate_gas round trips
+        estimates = []
+        for cert in certificates:
+            try:
+                function = self.contract.functions.issueCertificate(
+                    self.bytes32_hash(cert['certificate_id']),
+                    self.bytes32_hash(cert['pii_hash']),
+                    cert['course_name'],
+                    cert['issuer_id']
+                )
+                estimates.append((function, _rpc_executor.submit(
+                    function.estimate_gas, {'from': self.sender_address}
+                )))
+            except Exception as e:
+                estimates.append((None, e))
+        
+        # Only the prefix before the first failure is sent, as below
+        tx_hashes = []
+        prepared = []
+        for function, estimate in estimates:
+            try:
+                if isinstance(estimate, Exception):
+                    raise estimate
+                prepared.append((function, int(estimate.result() * 1.2)))
+            except Exception as e:
+                error = str(e)
+                break
+        else:
+            error = None
+        
+        gas_price = gas_price_future.result()
+        chain_id = chain_id_future.result()
+        
+        with _sender_lock(self.sender_address):
+            nonce = self.web3.eth.get_transaction_count(self.sender_address, 'pending')
             
-            if not exists:
-                return {
-                    'found': False,
-                    'valid': False,
-                    'certificate_id': certificate_id,
-                    'blockchain': 'ethereum',
-                    'network': self.network,
+            for function, gas in prepared:
+                try:
+                    transaction = function.build_transaction({
+                        'from': self.sender_address,
+                        'gas': gas,
+                        'gasPrice': gas_price,
+                        'nonce': nonce,
+                        'chainId': chain_id,
+                    })
+                    
+                    signed_txn = self.web3.eth.account.sign_transaction(transaction, self.account.key)
+                    tx_hashes.append(self.web3.eth.send_raw_transaction(signed_txn.raw_transaction))
+                    nonce += 1
+                except Exception as e:
+                    # Nothing after a failed submission can use the skipped nonce
+                    # ordering safely, so the rest of the batch is not sent
+                    error = str(e)
+                    break
+        
+        if error is not None:
+            tx_hashes.append(error)
+        
+        results = []
+        for i, cert in enumerate(certificates):
+            if i >= len(tx_hashes):
+                results.append({
+                    'success': False,
+                    'error': 'Not submitted: an earlier certificate in the batch failed',
                     'contract_address': self.contract_address,
-                    'error': 'Certificate does not exist on Ethereum blockchain.',
-                }
-            
-            cert_data = self.contract.functions.certificates(cert_id_bytes32).call()
-            
-            pii_hash_bytes32 = cert_data[1] if isinstance(cert_data, (list, tuple)) else cert_data.piiHash
-            
-            if isinstance(pii_hash_bytes32, bytes):
-                pii_hash = pii_hash_bytes32.hex()
-            else:
-                pii_hash = pii_hash_bytes32.hex() if hasattr(pii_hash_bytes32, 'hex') else str(pii_hash_bytes32)
+                    'network': self.network
+                })
+                continue
             
-            if pii_hash.startswith('0x'):
-                pii_hash = pii_hash[2:]
-            if len(pii_hash) > 64:
-                pii_hash = pii_hash[:64]
-            elif len(pii_hash) < 64:
-                pii_hash = pii_hash.zfill(64)
+            if isinstance(tx_hashes[i], str):
+                results.append({
+                    'success': False,
+                    'error': tx_hashes[i],
+                    'contract_address': self.contract_address,
+                    'network': self.network
+                })
+                continue
             
-            return self.verify_certificate(certificate_id, pii_hash)
-        except Exception as e:
-            error_msg = str(e)
-            if 'contract' in error_msg.lower() or 'deployed' in error_msg.lower() or 'synced' in error_msg.lower() or 'connection' in error_msg.lower():
-                return {
-                    'found': False,
-                    'valid': False,
-                    'certificate_id': certificate_id,
-                    'blockchain': 'ethereum',
-                    'network': self.network,
+            # Invalidate even if the receipt wait fails: the transaction may
+            # still be mined, and a cached "not found" must not hide it
+            self.invalidate_cache(cert['certificate_id'])
+            try:
+                receipt = self.web3.eth.wait_for_transaction_receipt(tx_hashes[i])
+            except Exception as e:
+                # The transaction may still be mined later; it can be
+                # re-checked with the hash reported here
+                results.append({
+                    'success': False,
+                    'transaction_hash': tx_hashes[i].hex(),
+                    'error': f'Could not get transaction receipt: {str(e)}',
                     'contract_address': self.contract_address,
-                    'error': f'Failed to connect to Ethereum contract. Make sure Hardhat node is running and contract is deployed. Error: {error_msg}',
-                    'debug': {
-                        'certificate_id': certificate_id,
-                        'exception': error_msg,
-                        'rpc_url': self._get_rpc_url(self.network),
-                        'contract_address': self.contract_address
-                    }
-                }
-            else:
-                raise
+                    'network': self.network
+                })
+                continue
+            
+            result = {
+                'success': receipt.status == 1,
+                'transaction_hash': receipt.transactionHash.hex(),
+                'block_number': receipt.blockNumber,
+                'gas_used': receipt.gasUsed,
+                'contract_address': self.contract_address,
+                'network': self.network
+            }
+            if receipt.status != 1:
+                result['error'] = f'Transaction failed with status {receipt.status}.'
+            results.append(result)
+        
+        return results
     
-    def verify_certificate(
-        self,
-        certificate_id: str,
-        pii_hash: str
-    ) -> Dict[str, Any]:
+    def verify_certificate_without_pii(self, certificate_id: str) -> Dict[str, Any]:
         """
-        Verify a certificate on Ethereum blockchain.
+        Verify a certificate on Ethereum blockchain without requiring PII hash.
+        
+        The stored record is read once through the public `certificates`
+        mapping, which already holds everything verification needs. Since the
+        PII hash compared against is the one on chain, the contract's
+        verifyCertificate would reduce to "exists and not revoked", so it is
+        evaluated here instead of costing more eth_call round trips.
         
         Args:
             certificate_id: Unique certificate identifier
-            pii_hash: SHA-256 hash of PII to verify against
             
         Returns:
-            dict: Verification result with 'found' field indicating if certificate exists
+            dict: Verification result with 'found' field indicating if certificate exists,
+                plus the on-chain course_name, issuer_id and revocation_reason
         """
-        cert_id_bytes32 = self.bytes32_hash(certificate_id)
-        pii_hash_bytes32 = self.bytes32_hash(pii_hash)
-        
         try:
-            exists = self.contract.functions.certificateExists(cert_id_bytes32).call()
+            cert_id_bytes32 = self.bytes32_hash(certificate_id)
+            cert_data = self.contract.functions.certificates(cert_id_bytes32).call()
             
-            if not exists:
+            # Unset mapping entries come back zeroed (certificateExists checks the same)
+            if cert_data[0] == bytes(32):
                 return {
                     'found': False,
                     'valid': False,
@@ -330,46 +490,37 @@ class EthereumService:
                     'blockchain': 'ethereum',
                     'network': self.network,
                     'contract_address': self.contract_address,
-                    'error': 'Certificate does not exist on Ethereum blockchain. It may have been issued on the custom blockchain before switching to Ethereum. Please re-issue the certificate on Ethereum.',
-                    'debug': {
-                        'certificate_id': certificate_id,
-                        'cert_id_bytes32_hex': cert_id_bytes32.hex()
-                    }
+                    'error': 'Certificate does not exist on Ethereum blockchain.',
                 }
             
-            cert_data = self.contract.functions.certificates(cert_id_bytes32).call()
-            
-            issuer = cert_data[2] if isinstance(cert_data, (list, tuple)) else cert_data.issuer
-            
+            issuer = cert_data[2]
             if isinstance(issuer, bytes):
-                issuer_str = issuer.hex() if hasattr(issuer, 'hex') else str(issuer)
+                issuer_str = issuer.hex()
             else:
                 issuer_str = str(issuer).lower()
             
-            if issuer_str.startswith('0x'):
-                issuer_str = issuer_str.lower()
-            else:
-                issuer_str = '0x' + issuer_str.lower()
-            
-            result = self.contract.functions.verifyCertificate(
-                cert_id_bytes32,
-                pii_hash_bytes32
-            ).call()
+            if not issuer_str.startswith('0x'):
+                issuer_str = '0x' + issuer_str
             
-            valid, issuer_from_verify, timestamp, revoked = result
+            revoked = cert_data[4]
             
-            if isinstance(issuer_from_verify, bytes):
-                issuer_str = issuer_from_verify.hex()
-            else:
-                issuer_str = str(issuer_from_verify).lower()
-            
-            if issuer_str.startswith('0x'):
-                issuer_str = issuer_str.lower()
-            else:
-                issuer_str = '0x' + issuer_str.lower()
+            return {
+                'found': True,
+                'valid': not revoked,
+                'issuer': issuer_str,
+                'timestamp': cert_data[3],
+                'revoked': revoked,
+                'course_name': cert_data[5],
+                'issuer_id': cert_data[6],
+                'revocation_reason': cert_data[7] if revoked else None,
+                'certificate_id': certificate_id,
+                'blockchain': 'ethereum',
+                'network': self.network,
+                'contract_address': self.contract_address
+            }
         except Exception as e:
             error_msg = str(e)
-            if 'contract' in error_msg.lower() or 'deployed' in error_msg.lower() or 'synced' in error_msg.lower():
+            if 'contract' in error_msg.lower() or 'deployed' in error_msg.lower() or 'synced' in error_msg.lower() or 'connection' in error_msg.lower():
                 return {
                     'found': False,
                     'valid': False,
@@ -377,39 +528,16 @@ class EthereumService:
                     'blockchain': 'ethereum',
                     'network': self.network,
                     'contract_address': self.contract_address,
-                    'error': 'Failed to connect to Ethereum contract. Make sure Hardhat node is running and contract is deployed.',
+                    'error': f'Failed to connect to Ethereum contract. Make sure Hardhat node is running and contract is deployed. Error: {error_msg}',
                     'debug': {
                         'certificate_id': certificate_id,
-                        'exception': error_msg
+                        'exception': error_msg,
+                        'rpc_url': self._get_rpc_url(self.network),
+                        'contract_address': self.contract_address
                     }
                 }
             else:
-                return {
-                    'found': False,
-                    'valid': False,
-                    'certificate_id': certificate_id,
-                    'blockchain': 'ethereum',
-                    'network': self.network,
-                    'contract_address': self.contract_address,
-                    'error': 'Certificate does not exist on Ethereum blockchain. It may have been issued on the custom blockchain before switching to Ethereum.',
-                    'debug': {
-                        'certificate_id': certificate_id,
-                        'cert_id_bytes32_hex': cert_id_bytes32.hex(),
-                        'exception': error_msg
-                    }
-                }
-        
-        return {
-            'found': True,
-            'valid': valid,  # Valid if verification passed
-            'issuer': issuer_str,
-            'timestamp': timestamp,
-            'revoked': revoked,
-            'certificate_id': certificate_id,
-            'blockchain': 'ethereum',
-            'network': self.network,
-            'contract_address': self.contract_address
-        }
+                raise
     
     def revoke_certificate(
         self,
@@ -436,20 +564,8 @@ class EthereumService:
             reason
         )
         
-        gas_estimate = function.estimate_gas({'from': self.sender_address})
-        
-        transaction = function.build_transaction({
-            'from': self.sender_address,
-            'gas': int(gas_estimate * 1.2),
-            'gasPrice': self.web3.eth.gas_price,
-            'nonce': self.web3.eth.get_transaction_count(self.sender_address),
-        })
-        
-        signed_txn = self.web3.eth.account.sign_transaction(transaction, self.account.key)
-        
-        tx_hash = self.web3.eth.send_raw_transaction(signed_txn.raw_transaction)
-        
-        receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash)
+        receipt = self._send_transaction(function)
+        self.invalidate_cache(certificate_id)
         
         return {
             'success': receipt.status == 1,
@@ -464,26 +580,45 @@ class EthereumService:
         """
         Get certificate information from Ethereum.
         
+        Results (found or not found, but not RPC errors) are cached for
+        CERTIFICATE_CACHE_TTL seconds; call invalidate_cache() after changing
+        a certificate on chain. Revoked certificates can never change again
+        and are cached until evicted.
+        
         Args:
             certificate_id: Unique certificate identifier
             
         Returns:
             dict: Certificate information
         """
+        with self._certificate_cache_lock:
+            cached = self._revoked_certificate_cache.get(certificate_id)
+            if cached is None:
+                cached = self._certificate_cache.get(certificate_id)
+        if cached is not None:
+            return dict(cached)
+        
         cert_id_bytes32 = self.bytes32_hash(certificate_id)
         
         try:
-            exists = self.contract.functions.certificateExists(cert_id_bytes32).call()
-            if not exists:
-                return {
-                    'exists': False,
-                    'found': False,
-                    'error': 'Certificate does not exist on Ethereum blockchain'
-                }
-            
+            # One read of the public mapping; unset entries come back zeroed,
+            # which is exactly what certificateExists checks
             cert_data = self.contract.functions.certificates(cert_id_bytes32).call()
-            
+        except Exception as e:
             return {
+                'exists': False,
+                'found': False,
+                'error': str(e)
+            }
+        
+        if cert_data[0] == bytes(32):
+            result = {
+                'exists': False,
+                'found': False,
+                'error': 'Certificate does not exist on Ethereum blockchain'
+            }
+        else:
+            result = {
                 'exists': True,
                 'found': True,
                 'certificate_id': certificate_id,
@@ -498,35 +633,80 @@ class EthereumService:
                 'network': self.network,
                 'contract_address': self.contract_address
             }
-        except Exception as e:
-            return {
-                'exists': False,
-                'found': False,
-                'error': str(e)
-            }
+        
+        with self._certificate_cache_lock:
+            if result.get('revoked'):
+                self._revoked_certificate_cache[certificate_id] = result
+            else:
+                self._certificate_cache[certificate_id] = result
+        return dict(result)
+    
+    def invalidate_cache(self, certificate_id: str) -> None:
+        """Drop the cached get_certificate() result for a certificate."""
+        with self._certificate_cache_lock:
+            self._certificate_cache.pop(certificate_id, None)
+    
+    def get_certificates_batch(self, certificate_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get information for several certificates from Ethereum concurrently.
+        
+        web3.py 6 has no JSON-RPC batching, so the lookups are spread over the
+        shared RPC thread pool; a page of N certificates then costs roughly
+        N / pool size round trips of latency instead of N.
+        
+        Args:
+            certificate_ids: Certificate identifiers to look up
+            
+        Returns:
+            dict: get_certificate() result keyed by certificate_id (errors are
+                reported per certificate, as get_certificate does)
+        """
+        unique_ids = list(dict.fromkeys(certificate_ids))
+        return dict(zip(unique_ids, _rpc_executor.map(self.get_certificate, unique_ids)))
     
     def is_connected(self) -> bool:
         """Check if connected to Ethereum network."""
         return self.web3.is_connected()
     
     def get_network_info(self) -> Dict[str, Any]:
-        """Get current network information."""
+        """
+        Get current network information.
+        
+        Results are cached for NETWORK_INFO_TTL seconds since each refresh
+        costs three RPC round trips (chain id, block number, gas price). If
+        the node fails, the last good snapshot is served for up to
+        NETWORK_INFO_STALE_TTL seconds.
+        """
+        now = time.monotonic()
+        with self._network_info_lock:
+            cached = self._network_info
+            cached_at = self._network_info_at
+        
+        if cached and now - cached_at < NETWORK_INFO_TTL:
+            return dict(cached)
+        
         try:
             chain_id = self.web3.eth.chain_id
             block_number = self.web3.eth.block_number
             gas_price = self.web3.eth.gas_price
-            
-            return {
-                'network': self.network,
-                'chain_id': chain_id,
-                'block_number': block_number,
-                'gas_price': gas_price,
-                'contract_address': self.contract_address,
-                'connected': True
-            }
         except Exception as e:
+            if cached and now - cached_at < NETWORK_INFO_STALE_TTL:
+                return dict(cached)
             return {
                 'connected': False,
                 'error': str(e)
             }
+        
+        info = {
+            'network': self.network,
+            'chain_id': chain_id,
+            'block_number': block_number,
+            'gas_price': gas_price,
+            'contract_address': self.contract_address,
+            'connected': True
+        }
+        with self._network_info_lock:
+            self._network_info = info
+            self._network_info_at = now
+        return dict(info)
 
@@ -9,19 +9,29 @@ It includes:
 - Role-based access control (admin, institution, student)
 
 Security Features:
-- Bcrypt password hashing with salt
+- Argon2id password hashing with salt (legacy bcrypt hashes are verified
+  and upgraded on the next successful login)
 - JWT tokens with expiration
 - Role-based authorization
 - Token validation on every protected request
+
+The dependencies below are plain `def` functions because they query the
+database synchronously; FastAPI runs them in its threadpool.
 """
 
-from datetime import datetime, timedelta
+from datetime import timedelta
 from typing import Optional
 from jose import JWTError, jwt
+import base64
+import hashlib
+import hmac
+import orjson
+import time
 from passlib.context import CryptContext
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
+from ..config import get_settings
 from ..database import get_db
 from ..models.db_models import User
 
@@ -39,37 +49,44 @@ ALGORITHM = "HS256"
 # Token expiration time in minutes
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
+def _b64url(data: bytes) -> bytes:
+    """Unpadded base64url encoding, as used by JWT."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+# The JWT header never changes, so it is encoded once at import
+_JWT_HEADER_B64 = _b64url(orjson.dumps({"alg": ALGORITHM, "typ": "JWT"}))
+_SECRET_KEY_BYTES = SECRET_KEY.encode("utf-8")
+
 # ============================================================================
 # Password Hashing Configuration
 # ============================================================================
 
-# CryptContext for password hashing using bcrypt
-# bcrypt automatically handles salt generation and is resistant to timing attacks
-# Note: Using bcrypt 3.2.2 for compatibility with passlib 1.7.4
-# IMPORTANT: Do not use bcrypt 4.x as it's incompatible with passlib 1.7.4
+# New hashes use Argon2id (memory-hard, so GPU/ASIC guessing is far more
+# expensive per attempt than against bcrypt at the same server latency).
+# passlib needs argon2-cffi for it; without it every hash would fail, so the
+# app refuses to start instead of failing on each registration.
 try:
-    import bcrypt
-    if hasattr(bcrypt, '__version__'):
-        bcrypt_version = bcrypt.__version__
-    elif hasattr(bcrypt, '__about__'):
-        bcrypt_version = bcrypt.__about__.__version__
-    else:
-        bcrypt_version = "unknown"
-    # Warn if wrong version
-    if not bcrypt_version.startswith('3.'):
-        import warnings
-        warnings.warn(
-            f"Warning: bcrypt version {bcrypt_version} detected. "
-            "This may cause compatibility issues with passlib 1.7.4. "
-            "Please install bcrypt==3.2.2: pip install bcrypt==3.2.2"
-        )
-except ImportError:
-    pass
+    import argon2  # noqa: F401
+except ImportError as e:
+    raise ImportError(
+        "argon2-cffi is required for password hashing: pip install argon2-cffi==23.1.0"
+    ) from e
 
+# Argon2id cost parameters, tunable per host through ARGON2_* environment
+# variables. Defaults are the OWASP baseline: 46 MiB, 3 iterations, 1 lane.
+# bcrypt stays only to verify hashes created before the switch; it is marked
+# deprecated, so password_needs_rehash() flags old bcrypt hashes and the
+# login endpoint re-hashes them with Argon2id.
+_settings = get_settings()
 pwd_context = CryptContext(
-    schemes=["bcrypt"],
-    deprecated="auto",
-    bcrypt__rounds=12  # Number of rounds for bcrypt (higher = more secure but slower)
+    schemes=["argon2", "bcrypt"],
+    deprecated=["bcrypt"],
+    argon2__type="ID",
+    argon2__time_cost=_settings.argon2_time_cost,
+    argon2__memory_cost=_settings.argon2_memory_cost,  # KiB
+    argon2__parallelism=_settings.argon2_parallelism,
+    argon2__digest_size=32,
+    argon2__salt_size=16,
 )
 
 # ============================================================================
@@ -86,9 +103,12 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
-    Verify a plain text password against a bcrypt hash.
+    Verify a plain text password against a stored Argon2id or bcrypt hash.
     
-    This function uses bcrypt's constant-time comparison to prevent timing attacks.
+    The scheme is detected from the hash prefix ($argon2id$ or $2b$), and the
+    comparison is constant-time to prevent timing attacks. The password is
+    truncated exactly as in get_password_hash, so passwords longer than 72
+    bytes verify against the hash they were stored with.
     
     Args:
         plain_password: The password provided by the user (plain text)
@@ -97,22 +117,70 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         bool: True if password matches, False otherwise
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    return pwd_context.verify(truncate_password(plain_password), hashed_password)
+
+# bcrypt only uses the first 72 bytes of a password; the same limit is kept
+# for Argon2id so all stored hashes follow one rule
+BCRYPT_MAX_BYTES = 72
+
+def truncate_password(password: str) -> str:
+    """
+    Truncate a password to bcrypt's 72-byte limit on a UTF-8 character boundary.
+    
+    ASCII passwords (the common case) are sliced directly without encoding.
+    Otherwise the password is encoded once and the cut point is moved back
+    past any UTF-8 continuation bytes (at most 3), so no partial character
+    is kept.
+    
+    Args:
+        password: Plain text password
+    
+    Returns:
+        str: The password, limited to 72 UTF-8 bytes
+    """
+    if password.isascii():
+        return password[:BCRYPT_MAX_BYTES]
+    
+    password_bytes = password.encode('utf-8')
+    if len(password_bytes) <= BCRYPT_MAX_BYTES:
+        return password
+    
+    cut = BCRYPT_MAX_BYTES
+    while cut > 0 and (password_bytes[cut] & 0xC0) == 0x80:
+        cut -= 1
+    return password_bytes[:cut].decode('utf-8')
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """
+    Check whether a stored hash was created with outdated hashing settings.
+    
+    Used after a successful login to lazily migrate hashes when the scheme
+    or its parameters change (see pwd_context).
+    
+    Args:
+        hashed_password: The stored password hash from the database
+    
+    Returns:
+        bool: True if the password should be re-hashed with current settings
+    """
+    return pwd_context.needs_update(hashed_password)
 
 def get_password_hash(password: str) -> str:
     """
-    Hash a password using bcrypt.
+    Hash a password using Argon2id.
     
-    Bcrypt automatically generates a salt and includes it in the hash.
-    Each call produces a different hash even for the same password (due to salt).
+    A random salt is generated and included in the encoded hash, so each
+    call produces a different hash even for the same password.
     
-    Note: Bcrypt has a 72-byte limit for passwords. Longer passwords are truncated.
+    Note: Passwords are still truncated to 72 bytes. Argon2 has no such
+    limit, but existing accounts were registered under bcrypt's limit and
+    the registration validator enforces it, so the rule stays uniform.
     
     Args:
         password: Plain text password to hash (max 72 bytes)
     
     Returns:
-        str: Bcrypt hash string (includes salt)
+        str: Encoded Argon2id hash string (includes salt and parameters)
     
     Raises:
         ValueError: If password is empty or None
@@ -120,23 +188,8 @@ def get_password_hash(password: str) -> str:
     if not password:
         raise ValueError("Password cannot be empty")
     
-    # CRITICAL: Bcrypt has a 72-byte limit
-    # Truncate password BEFORE passing to passlib to avoid internal errors
-    # Convert to bytes to check length accurately (handles multi-byte characters)
-    password_bytes = password.encode('utf-8')
-    if len(password_bytes) > 72:
-        # Truncate to exactly 72 bytes
-        password_bytes = password_bytes[:72]
-        # Decode back to string, handling potential incomplete UTF-8 sequences
-        password = password_bytes.decode('utf-8', errors='ignore')
-        # If truncation broke a multi-byte character, remove the last character
-        # to ensure we have a valid UTF-8 string
-        try:
-            password.encode('utf-8')
-        except UnicodeEncodeError:
-            # If still invalid, take first 71 bytes and try again
-            password_bytes = password_bytes[:71]
-            password = password_bytes.decode('utf-8', errors='ignore')
+    # Truncate to 72 bytes, matching verify_password and legacy bcrypt hashes
+    password = truncate_password(password)
     
     # Now hash the (potentially truncated) password
     return pwd_context.hash(password)
@@ -152,6 +205,10 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     The token contains user information (username, role) and an expiration time.
     Tokens are signed with the secret key to prevent tampering.
     
+    The token is assembled directly (precomputed header, orjson payload,
+    HMAC-SHA256 signature) rather than through python-jose's generic encoder,
+    since this runs on every login. The output is a standard HS256 JWT.
+    
     Args:
         data: Dictionary containing user data to encode in token (e.g., {"sub": username, "role": "institution"})
         expires_delta: Optional custom expiration time. If None, uses default ACCESS_TOKEN_EXPIRE_MINUTES
@@ -159,21 +216,19 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     Returns:
         str: Encoded JWT token string
     """
-    # Copy data to avoid modifying the original
-    to_encode = data.copy()
-    
-    # Set expiration time
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    
-    # Add expiration to token payload
-    to_encode.update({"exp": expire})
-    
-    # Encode and sign the token
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
-    return encoded_jwt
+    # Set expiration time (seconds since epoch, as required by the JWT spec)
+    if expires_delta is None:
+        expires_delta = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    expire = int(time.time() + expires_delta.total_seconds())
+    
+    # Add expiration to token payload (copy to avoid modifying the original)
+    payload_b64 = _b64url(orjson.dumps({**data, "exp": expire}))
+    
+    # Sign header.payload with HMAC-SHA256 (ALGORITHM); tokens are decoded
+    # and verified by python-jose in verify_token
+    signing_input = _JWT_HEADER_B64 + b"." + payload_b64
+    signature = hmac.new(_SECRET_KEY_BYTES, signing_input, hashlib.sha256).digest()
+    return (signing_input + b"." + _b64url(signature)).decode("ascii")
 
 def verify_token(token: str, credentials_exception) -> str:
     """
@@ -210,7 +265,8 @@ def verify_token(token: str, credentials_exception) -> str:
 # FastAPI Dependencies for Route Protection
 # ============================================================================
 
-async def get_current_user(
+def get_current_user(
+    request: Request,
     token: str = Depends(oauth2_scheme),
     db: Session = Depends(get_db)
 ) -> User:
@@ -223,12 +279,17 @@ async def get_current_user(
     3. Looks up the user in the database
     4. Returns the user object if valid
     
+    The resolved user is pinned on `request.state.current_user`, so any later
+    lookup in the same request (other dependencies, handlers) reuses it
+    instead of querying the database again.
+    
     Usage:
         @router.get("/protected")
         async def protected_route(current_user: User = Depends(get_current_user)):
             return {"user": current_user.username}
     
     Args:
+        request: Incoming request (used for per-request caching)
         token: JWT token extracted from Authorization header (via oauth2_scheme)
         db: Database session (injected by FastAPI)
     
@@ -239,6 +300,11 @@ async def get_current_user(
         HTTPException: 401 if token is invalid or user not found
         HTTPException: 400 if user account is inactive
     """
+    # Already resolved earlier in this request
+    cached_user = getattr(request.state, "current_user", None)
+    if cached_user is not None:
+        return cached_user
+    
     # Exception to raise if authentication fails
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -258,9 +324,10 @@ async def get_current_user(
     if not user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
     
+    request.state.current_user = user
     return user
 
-async def get_current_active_admin(
+def get_current_active_admin(
     current_user: User = Depends(get_current_user)
 ) -> User:
     """
@@ -291,7 +358,7 @@ async def get_current_active_admin(
         )
     return current_user
 
-async def get_current_institution(
+def get_current_institution(
     current_user: User = Depends(get_current_user)
 ) -> User:
     """
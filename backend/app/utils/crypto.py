@@ -8,6 +8,7 @@ Note: This module contains basic utilities. For ECDSA signing, see ecdsa_utils.p
 """
 
 import hashlib
+import hmac
 import secrets
 import string
 
@@ -71,8 +72,12 @@ def verify_hash(data: str, hash_value: str) -> bool:
     
     Returns:
         bool: True if data hash matches expected hash, False otherwise
+    
+    Note:
+        Uses hmac.compare_digest (constant-time) so the comparison doesn't
+        leak how many leading characters matched
     """
-    return hash_data(data) == hash_value
+    return hmac.compare_digest(hash_data(data), hash_value)
 
 # ============================================================================
 # Certificate Hash Generation
@@ -0,0 +1,90 @@
+"""
+HTTP Caching Utilities Module
+
+This module provides helpers for serving read-only JSON endpoints with HTTP
+caching headers, so browsers and reverse proxies can absorb repeated polling
+instead of every request reaching the API.
+
+It includes:
+- ETag generation from the serialized response body
+- Conditional requests (If-None-Match -> 304 Not Modified)
+- Cache-Control headers for short-lived public data
+"""
+
+import hashlib
+from typing import Any, Optional
+
+import orjson
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+
+def make_etag(body: bytes) -> str:
+    """
+    Create a strong ETag for a response body.
+    
+    Args:
+        body: Serialized response body
+    
+    Returns:
+        str: Quoted ETag value (128-bit BLAKE2b digest of the body)
+    """
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """
+    Check whether the client already has the representation with this ETag.
+    
+    Args:
+        request: Incoming request (If-None-Match header is read)
+        etag: Quoted ETag of the current representation
+    
+    Returns:
+        bool: True if If-None-Match contains the ETag (or "*")
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag or candidate == "*":
+            return True
+    return False
+
+def cached_json_response(
+    request: Request,
+    content: Any,
+    cache_control: Optional[str] = None
+) -> Response:
+    """
+    Serialize content to JSON and answer conditional requests.
+    
+    If the client sent a matching If-None-Match header, an empty 304 response
+    is returned. Otherwise the JSON body is returned with an ETag header.
+    
+    Args:
+        request: Incoming request
+        content: JSON-serializable response content
+        cache_control: Optional Cache-Control header value
+    
+    Returns:
+        Response: 304 Not Modified or 200 JSON response with caching headers
+    """
+    try:
+        # orjson natively handles dicts, lists, datetimes, UUIDs, ...
+        body = orjson.dumps(content)
+    except TypeError:
+        # Anything else (e.g. Pydantic models) goes through FastAPI's encoder
+        body = orjson.dumps(jsonable_encoder(content))
+    etag = make_etag(body)
+    
+    headers = {"ETag": etag}
+    if cache_control:
+        headers["Cache-Control"] = cache_control
+    
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    
+    return Response(content=body, media_type="application/json", headers=headers)
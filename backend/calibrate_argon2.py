@@ -0,0 +1,115 @@
+"""
+Script to calibrate Argon2id password hashing cost for this machine.
+
+It measures how long one hash takes on the current host and finds the
+highest ARGON2_TIME_COST whose median hash time stays within a latency
+budget, keeping the configured memory cost and parallelism. Add the printed
+value to backend/.env so logins cost the same on every deployment while
+attackers pay as much as this server can afford.
+
+Usage:
+    python calibrate_argon2.py              # 250 ms budget
+    python calibrate_argon2.py 500          # 500 ms budget
+"""
+import sys
+import os
+import statistics
+import time
+sys.stdout.reconfigure(encoding='utf-8')
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from dotenv import load_dotenv
+load_dotenv()
+
+from argon2 import PasswordHasher
+from app.config import get_settings
+
+# Samples per measurement; the median ignores one-off scheduler hiccups
+SAMPLES = 5
+
+# Never search past this many iterations (guards against a huge budget)
+MAX_TIME_COST = 64
+
+def measure_ms(time_cost: int, memory_cost: int, parallelism: int) -> float:
+    """
+    Measure the median time to hash a probe password.
+    
+    Args:
+        time_cost: Argon2id iterations
+        memory_cost: Argon2id memory in KiB
+        parallelism: Argon2id lanes
+    
+    Returns:
+        float: Median hash time in milliseconds
+    """
+    hasher = PasswordHasher(
+        time_cost=time_cost,
+        memory_cost=memory_cost,
+        parallelism=parallelism,
+        hash_len=32,
+        salt_len=16,
+    )
+    timings = []
+    for _ in range(SAMPLES):
+        start = time.perf_counter()
+        hasher.hash("calibration-probe")
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+def calibrate_argon2(target_ms: float):
+    """Find and print the highest time cost that fits in target_ms."""
+    settings = get_settings()
+    memory_cost = settings.argon2_memory_cost
+    parallelism = settings.argon2_parallelism
+    
+    print(f"\n{'='*80}")
+    print("Argon2id Calibration")
+    print(f"{'='*80}")
+    print(f"  Target latency: {target_ms:.0f} ms")
+    print(f"  Memory cost:    {memory_cost} KiB ({memory_cost / 1024:.0f} MiB)")
+    print(f"  Parallelism:    {parallelism}")
+    print(f"  Current ARGON2_TIME_COST: {settings.argon2_time_cost}\n")
+    
+    measured = {}
+    
+    def fits(time_cost: int) -> bool:
+        measured[time_cost] = measure_ms(time_cost, memory_cost, parallelism)
+        print(f"  time_cost={time_cost:<3} {measured[time_cost]:8.1f} ms")
+        return measured[time_cost] <= target_ms
+    
+    if not fits(1):
+        print("\n⚠️  Even time_cost=1 exceeds the target.")
+        print("   Lower ARGON2_MEMORY_COST or raise the latency budget.")
+        best = 1
+    else:
+        # Hash time grows linearly with time_cost: double to find an upper
+        # bound, then binary search between the last fit and the first miss
+        low, high = 1, 2
+        while high <= MAX_TIME_COST and fits(high):
+            low, high = high, high * 2
+        high = min(high, MAX_TIME_COST + 1)
+        while high - low > 1:
+            mid = (low + high) // 2
+            if mid in measured:
+                ok = measured[mid] <= target_ms
+            else:
+                ok = fits(mid)
+            if ok:
+                low = mid
+            else:
+                high = mid
+        best = low
+    
+    print(f"\n{'='*80}")
+    print(f"Recommended setting ({measured[best]:.1f} ms per hash):")
+    print(f"  ARGON2_TIME_COST={best}")
+    print(f"  ARGON2_MEMORY_COST={memory_cost}")
+    print(f"  ARGON2_PARALLELISM={parallelism}")
+    print(f"{'='*80}\n")
+    print("Add these lines to backend/.env and restart the API.")
+    print("New passwords are hashed with the new cost; existing hashes keep verifying.\n")
+
+if __name__ == "__main__":
+    target = float(sys.argv[1]) if len(sys.argv) > 1 else 250.0
+    calibrate_argon2(target)
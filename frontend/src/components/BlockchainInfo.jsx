@@ -71,11 +71,19 @@ const BlockchainInfo = () => {
     setResult(null)
 
     try {
-      const response = await certificateAPI.getAll()
+      // /all is paged, so the overall total comes from /stats; the verified
+      // counts only cover the pages loaded so far
+      const [response, stats] = await Promise.all([
+        certificateAPI.getAll(),
+        certificateAPI.getStats().catch(() => null),
+      ])
       if (response && response.certificates && response.certificates.length > 0) {
         setResult({
           type: 'success',
-          data: response,
+          data: {
+            ...response,
+            total: stats ? stats.total : null,
+          },
         })
       } else {
         setResult({
@@ -93,6 +101,32 @@ const BlockchainInfo = () => {
     }
   }
 
+  const handleLoadMoreCertificates = async () => {
+    const current = result.data
+    setLoading(true)
+
+    try {
+      const response = await certificateAPI.getAll({ cursor: current.next_cursor })
+      setResult({
+        type: 'success',
+        data: {
+          ...response,
+          total: current.total,
+          certificates: [...current.certificates, ...(response.certificates || [])],
+          verified_count: (current.verified_count || 0) + (response.verified_count || 0),
+          not_verified_count: (current.not_verified_count || 0) + (response.not_verified_count || 0),
+        },
+      })
+    } catch (error) {
+      setResult({
+        type: 'error',
+        message: extractErrorMessage(error) || 'Network error',
+      })
+    } finally {
+      setLoading(false)
+    }
+  }
+
   return (
     <div className="card">
       <h2>
@@ -162,9 +196,11 @@ const BlockchainInfo = () => {
                 <>
                   <h3>📋 All Certificates on Blockchain</h3>
                   <div style={{ marginBottom: '15px', padding: '10px', backgroundColor: '#e7f3ff', borderRadius: '4px' }}>
-                    <strong>Summary:</strong> {result.data.count} total | {' '}
-                    <span style={{ color: '#2e7d32' }}>✅ {result.data.verified_count || 0} verified on Ethereum</span> | {' '}
-                    <span style={{ color: '#f57c00' }}>⚠️ {result.data.not_verified_count || 0} not found</span>
+                    <strong>Summary:</strong>{' '}
+                    {result.data.total != null ? `${result.data.total} total | ` : ''}
+                    {result.data.certificates.length} loaded | {' '}
+                    <span style={{ color: '#2e7d32' }}>✅ {result.data.verified_count || 0} of loaded verified on Ethereum</span> | {' '}
+                    <span style={{ color: '#f57c00' }}>⚠️ {result.data.not_verified_count || 0} of loaded not found</span>
                   </div>
                   <div style={{ display: 'grid', gap: '15px' }}>
                     {result.data.certificates.map((cert, index) => (
@@ -235,6 +271,17 @@ const BlockchainInfo = () => {
                       </div>
                     ))}
                   </div>
+                  {result.data.has_more && result.data.next_cursor != null && (
+                    <button
+                      onClick={handleLoadMoreCertificates}
+                      className="btn btn-secondary"
+                      disabled={loading}
+                      style={{ marginTop: '15px' }}
+                    >
+                      <i className="fas fa-chevron-down"></i>{' '}
+                      {loading ? 'Loading...' : 'Load More Certificates'}
+                    </button>
+                  )}
                 </>
               ) : (
                 <>
@@ -12,12 +12,23 @@ const StudentPortfolio = () => {
     setResult(null)
 
     try {
-      const response = await certificateAPI.getByStudent(studentId)
+      // The endpoint is paged; follow next_cursor so the portfolio (and its
+      // total) covers every certificate, not just the first page
+      let response = await certificateAPI.getByStudent(studentId)
+      const certificates = [...(response.certificates || [])]
+      while (response.has_more && response.next_cursor != null) {
+        response = await certificateAPI.getByStudent(studentId, { cursor: response.next_cursor })
+        certificates.push(...(response.certificates || []))
+      }
 
-      if (response.certificates && response.certificates.length > 0) {
+      if (certificates.length > 0) {
         setResult({
           type: 'success',
-          data: response,
+          data: {
+            ...response,
+            certificates,
+            count: certificates.length,
+          },
         })
       } else if (response.note) {
         // Ethereum limitation - show informational message
@@ -306,10 +306,11 @@ export const certificateAPI = {
    * Public endpoint - no authentication required.
    * 
    * @param {string} studentId - Student identifier
+   * @param {Object} [page] - Optional paging ({ limit, offset, cursor }); server default is 100 per page
    * @returns {Promise<Object>} Student's certificates
    */
-  getByStudent: async (studentId) => {
-    const response = await api.get(`/certificates/student/${studentId}`)
+  getByStudent: async (studentId, page = {}) => {
+    const response = await api.get(`/certificates/student/${studentId}`, { params: page })
     return response.data
   },
 
@@ -349,10 +350,24 @@ export const certificateAPI = {
    * 
    * Public endpoint - no authentication required.
    * 
+   * @param {Object} [page] - Optional paging ({ limit, offset, cursor }); server default is 100 per page
    * @returns {Promise<Object>} All certificates
    */
-  getAll: async () => {
-    const response = await api.get('/certificates/all')
+  getAll: async (page = {}) => {
+    const response = await api.get('/certificates/all', { params: page })
+    return response.data
+  },
+
+  /**
+   * Get certificate counts (total, active, revoked)
+   * 
+   * Public endpoint - no authentication required.
+   * Single database aggregate, no blockchain lookups; use for summary tiles.
+   * 
+   * @returns {Promise<Object>} Certificate counts
+   */
+  getStats: async () => {
+    const response = await api.get('/certificates/stats')
     return response.data
   },
 }